@@ -4,27 +4,33 @@ Backfill script to regenerate silver layer data from bronze layer.
 
 This script reads raw sensor data from the bronze layer (samples/) and
 recalculates all silver layer metrics (dew point, pressure trends, daily stats).
+The gold layer rollups for the affected days are rebuilt afterwards.
 
 Usage:
     python backfill_silver.py --days 7  # Backfill last 7 days
     python backfill_silver.py --days 1 --dry-run  # Preview without writing
+    python backfill_silver.py --days 30 --resume  # Continue an interrupted run
 """
 
 import argparse
 import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # Import our modules
-from src.weather.s3 import _s3, put_silver_reading
+from src.weather.s3 import put_silver_reading, get_day_readings, compact_day, add_to_manifest, storage_location
+from src.weather.gold import rebuild_gold_days
+from src.weather.hot import hot_tier
 from src.weather.settings import settings
 from src.weather.calculations import (
-    calculate_dew_point,
-    calculate_pressure_trend,
-    calculate_daily_stats,
-    get_comfort_index
+    summarize_pressure_trend,
+    DailyStatsAccumulator
 )
+from src.weather.vectorized import enrich_batch, COMFORT_CATEGORIES
 
 
 def fetch_bronze_readings_for_period(start_date: datetime, end_date: datetime) -> List[Dict]:
@@ -50,41 +56,22 @@ def fetch_bronze_readings_for_period(start_date: datetime, end_date: datetime) -
     print(f"📦 Fetching bronze data for {len(dates_to_check)} day(s): {dates_to_check[0]} to {dates_to_check[-1]}")
     
     for date in dates_to_check:
-        prefix = f"{settings.s3_prefix}/{date}/"
+        # Finished days come from the compacted daily file when available
+        day_readings, errors = get_day_readings(settings.s3_prefix, date, start=start_date, end=end_date)
+        for key, error in errors.items():
+            print(f"⚠️  Error reading {key}: {error}")
         
-        try:
-            paginator = _s3.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=settings.s3_bucket, Prefix=prefix)
-            
-            count = 0
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
-                
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    
-                    try:
-                        response = _s3.get_object(Bucket=settings.s3_bucket, Key=key)
-                        data = json.loads(response['Body'].read().decode('utf-8'))
-                        
-                        # Parse timestamp and filter by date range
-                        reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
-                        
-                        if start_date <= reading_time <= end_date:
-                            readings.append(data)
-                            count += 1
-                    
-                    except Exception as e:
-                        print(f"⚠️  Error reading {key}: {e}")
-                        continue
+        count = 0
+        for data in day_readings:
+            # Parse timestamp and filter by date range
+            reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
             
-            if count > 0:
-                print(f"  ✓ {date}: {count} readings")
+            if start_date <= reading_time <= end_date:
+                readings.append(data)
+                count += 1
         
-        except Exception as e:
-            print(f"⚠️  Error listing objects for {date}: {e}")
-            continue
+        if count > 0:
+            print(f"  ✓ {date}: {count} readings")
     
     # Sort by timestamp
     readings.sort(key=lambda x: x['ts'])
@@ -95,63 +82,168 @@ def fetch_bronze_readings_for_period(start_date: datetime, end_date: datetime) -
 
 def create_silver_reading_backfill(
     bronze_reading: Dict, 
-    all_readings_for_trends: List[Dict],
-    daily_readings: List[Dict]
+    dew_point: Dict,
+    comfort_index: str,
+    pressure_trend: Dict,
+    daily_stats: Dict
 ) -> Dict:
     """
     Create enriched silver reading from bronze data with calculated metrics.
     
     Args:
         bronze_reading: Raw sensor reading
-        all_readings_for_trends: Historical readings for pressure trend calculation
-        daily_readings: All readings from the same day for daily stats
+        dew_point: dew_point_c / dew_point_f for this reading
+        comfort_index: Comfort label for this reading
+        pressure_trend: Pressure trend metrics for this reading
+        daily_stats: Rolling daily stats up to and including this reading
     
     Returns:
         Enriched reading with calculated metrics
     """
     silver = bronze_reading.copy()
     
-    # 1. Calculate dew point
-    dew_point = calculate_dew_point(bronze_reading["temp_c"], bronze_reading["humidity"])
+    # 1. Dew point and 2. comfort index (computed for the whole batch up front)
     silver.update(dew_point)
+    silver["comfort_index"] = comfort_index
     
-    # 2. Calculate comfort index
-    silver["comfort_index"] = get_comfort_index(
-        bronze_reading["temp_f"], 
-        bronze_reading["humidity"],
-        dew_point["dew_point_f"]
-    )
-    
-    # 3. Calculate pressure trend
-    pressure_trend = calculate_pressure_trend(bronze_reading, all_readings_for_trends)
+    # 3. Pressure trend and 4. daily stats (computed by the caller's sliding window)
     silver.update(pressure_trend)
-    
-    # 4. Calculate daily stats
-    daily_stats = calculate_daily_stats(daily_readings)
     silver.update(daily_stats)
     
     return silver
 
 
-def backfill_silver_layer(days: int, dry_run: bool = False) -> Dict[str, int]:
+def _pressure_ago(
+    times: List[datetime],
+    pressures: List[float],
+    idx: int,
+    start: int,
+    min_hours: float,
+    max_hours: float
+) -> tuple[int, float | None]:
+    """
+    Find the oldest reading before `idx` that is between min_hours and max_hours old.
+    
+    `start` is where the previous search for this offset stopped. Since readings
+    are sorted, the pointer only ever moves forward, so all searches together
+    cost O(n). Matches the selection made by calculate_pressure_trend.
+    
+    Returns:
+        (new start pointer, pressure or None)
+    """
+    current_time = times[idx]
+    while start < idx and (current_time - times[start]).total_seconds() / 3600 > max_hours:
+        start += 1
+    if start < idx and (current_time - times[start]).total_seconds() / 3600 >= min_hours:
+        return start, pressures[start]
+    return start, None
+
+
+DEFAULT_CHECKPOINT = Path(__file__).parent / ".backfill_checkpoint.json"
+
+
+def load_checkpoint(path: Path) -> Optional[Dict]:
+    """Load the checkpoint file, or None if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path: Path, run: Dict, day: str, ts: str):
+    """
+    Atomically record the last day and reading timestamp fully written to silver.
+    
+    `run` identifies the run ({"days", "start", "end"}) so a resume can check it
+    continues the same one and reuse its exact period.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({**run, "day": day, "ts": ts}, f)
+    os.replace(tmp_path, path)
+
+
+def write_silver_batch(executor: ThreadPoolExecutor, silver_readings: List[Dict]) -> int:
+    """
+    Upload a batch of silver readings concurrently, then add them to their
+    days' manifests in one update per day.
+    
+    Returns:
+        Number of failed uploads
+    """
+    futures = {
+        executor.submit(put_silver_reading, silver, update_latest=False, update_manifest=False): silver
+        for silver in silver_readings
+    }
+    errors = 0
+    entries_by_date: Dict[str, List[Dict]] = {}
+    for future in as_completed(futures):
+        try:
+            entry = future.result()
+            entries_by_date.setdefault(entry["ts"][:10], []).append(entry)
+        except Exception as e:
+            print(f"\n⚠️  Error writing {futures[future]['ts']}: {e}")
+            errors += 1
+    
+    for date_str, entries in entries_by_date.items():
+        try:
+            add_to_manifest(settings.s3_silver_prefix, date_str, entries)
+        except Exception as e:
+            print(f"\n⚠️  Error updating manifest for {date_str}: {e}")
+            errors += len(entries)
+    return errors
+
+
+def backfill_silver_layer(
+    days: int,
+    dry_run: bool = False,
+    workers: int = 16,
+    resume: bool = False,
+    checkpoint_path: Path = DEFAULT_CHECKPOINT
+) -> Dict[str, int]:
     """
     Main backfill function.
     
+    Readings are enriched in order, then written one UTC day at a time with
+    `workers` concurrent uploads. After each day is fully written the checkpoint
+    file is updated, so an interrupted run can continue with `resume=True`; a
+    resumed run covers the same period as the interrupted one. The checkpoint is
+    deleted once a run finishes without errors.
+    
     Args:
         days: Number of days to backfill
         dry_run: If True, preview without writing
+        workers: Number of concurrent silver uploads
+        resume: Skip readings at or before the checkpoint timestamp
+        checkpoint_path: Where the checkpoint is stored
     
     Returns:
         Statistics dictionary
+    
+    Raises:
+        ValueError: If resuming from a checkpoint written by a run with a different `days`
     """
     # Calculate date range
     end_time = datetime.now(timezone.utc)
     start_time = end_time - timedelta(days=days)
     
+    checkpoint = load_checkpoint(checkpoint_path) if resume else None
+    if checkpoint:
+        if checkpoint.get("days") != days:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} belongs to a different run "
+                f"(--days {checkpoint.get('days', '?')}); resume with the same --days or delete it"
+            )
+        # Continue the interrupted run's exact period, not one shifted to now
+        start_time = datetime.fromisoformat(checkpoint["start"])
+        end_time = datetime.fromisoformat(checkpoint["end"])
+    run = {"days": days, "start": start_time.isoformat(), "end": end_time.isoformat()}
+    
     print(f"{'🔍 DRY RUN MODE' if dry_run else '🚀 BACKFILL MODE'}")
     print(f"Period: {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Bronze source: s3://{settings.s3_bucket}/{settings.s3_prefix}/")
-    print(f"Silver target: s3://{settings.s3_bucket}/{settings.s3_silver_prefix}/")
+    print(f"Bronze source: {storage_location()}/{settings.s3_prefix}/")
+    print(f"Silver target: {storage_location()}/{settings.s3_silver_prefix}/")
     print()
     
     # Fetch all bronze readings for the period
@@ -159,15 +251,34 @@ def backfill_silver_layer(days: int, dry_run: bool = False) -> Dict[str, int]:
     
     if not bronze_readings:
         print("❌ No bronze readings found for this period!")
-        return {"total": 0, "processed": 0, "written": 0, "errors": 0}
-    
-    # Group readings by date for daily stats calculation
-    readings_by_date = defaultdict(list)
-    for reading in bronze_readings:
-        date_str = reading["ts"][:10]  # Extract YYYY-MM-DD
-        readings_by_date[date_str].append(reading)
-    
-    print(f"📊 Processing {len(bronze_readings)} readings across {len(readings_by_date)} days\n")
+        return {"total": 0, "processed": 0, "written": 0, "errors": 0, "skipped": 0}
+    
+    # Readings up to the checkpoint are still enriched (the rolling windows need
+    # them) but are not written again
+    resume_after = None
+    if resume:
+        if checkpoint:
+            resume_after = checkpoint["ts"]
+            print(f"⏩ Resuming after {resume_after} (checkpoint {checkpoint_path})\n")
+        else:
+            print(f"No checkpoint found at {checkpoint_path}, starting from the beginning\n")
+    
+    # Parse every timestamp once; everything below walks these lists in order
+    times = [datetime.fromisoformat(r['ts'].replace('Z', '+00:00')) for r in bronze_readings]
+    pressures = [r["pressure"] for r in bronze_readings]
+    backfill_dates = {r["ts"][:10] for r in bronze_readings}
+    
+    print(f"📊 Processing {len(bronze_readings)} readings across {len(backfill_dates)} days\n")
+    
+    # Dew point and comfort index don't depend on other readings: one vectorized pass
+    enriched = enrich_batch(
+        [r["temp_c"] for r in bronze_readings],
+        [r["temp_f"] for r in bronze_readings],
+        [r["humidity"] for r in bronze_readings]
+    )
+    dew_points_c = enriched["dew_point_c"].tolist()
+    dew_points_f = enriched["dew_point_f"].tolist()
+    comfort_codes = enriched["comfort_code"].tolist()
     
     # Statistics
     stats = {
@@ -178,48 +289,120 @@ def backfill_silver_layer(days: int, dry_run: bool = False) -> Dict[str, int]:
         "skipped": 0
     }
     
+    # Sliding-window state: pointers to the oldest candidates ~3h and ~6h back,
+    # and running daily aggregates that reset at each UTC midnight
+    start_3h = 0
+    start_6h = 0
+    daily_stats = DailyStatsAccumulator()
+    
+    # Silver readings waiting to be written, one UTC day at a time
+    pending: List[Dict] = []
+    checkpoint_ok = True
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="backfill")
+    
+    def flush_day():
+        nonlocal checkpoint_ok
+        if not pending:
+            return
+        errors = write_silver_batch(executor, pending)
+        stats["written"] += len(pending) - errors
+        stats["errors"] += errors
+        
+        # Only advance the checkpoint while every earlier day was written cleanly
+        if errors:
+            checkpoint_ok = False
+        if checkpoint_ok:
+            save_checkpoint(checkpoint_path, run, pending[-1]["ts"][:10], pending[-1]["ts"])
+        pending.clear()
+    
     # Process each reading
-    for idx, bronze in enumerate(bronze_readings):
-        try:
-            reading_time = datetime.fromisoformat(bronze['ts'].replace('Z', '+00:00'))
-            date_str = bronze["ts"][:10]
-            
-            # Get historical context for pressure trends (look back 7 hours)
-            lookback_time = reading_time - timedelta(hours=7)
-            historical_readings = [
-                r for r in bronze_readings 
-                if lookback_time <= datetime.fromisoformat(r['ts'].replace('Z', '+00:00')) < reading_time
-            ]
-            
-            # Get all readings from same day for daily stats
-            # Filter to only readings up to current time (for accurate rolling stats)
-            daily_readings = [
-                r for r in readings_by_date[date_str]
-                if datetime.fromisoformat(r['ts'].replace('Z', '+00:00')) <= reading_time
-            ]
-            
-            # Create silver reading with all calculations
-            silver = create_silver_reading_backfill(bronze, historical_readings, daily_readings)
-            
-            stats["processed"] += 1
-            
-            # Write to S3 (unless dry run)
-            if not dry_run:
-                put_silver_reading(silver)
-                stats["written"] += 1
+    try:
+        for idx, bronze in enumerate(bronze_readings):
+            try:
+                start_3h, pressure_3h_ago = _pressure_ago(times, pressures, idx, start_3h, 2.5, 3.5)
+                start_6h, pressure_6h_ago = _pressure_ago(times, pressures, idx, start_6h, 5.5, 6.5)
+                pressure_trend = summarize_pressure_trend(
+                    bronze["pressure"], pressure_3h_ago, pressure_6h_ago
+                )
+                
+                # Rolling daily stats include every reading of the day up to this one
+                daily_stats.add(bronze)
+                
+                # Create silver reading with all calculations
+                if math.isnan(dew_points_c[idx]):
+                    raise ValueError(f"cannot compute dew point for humidity {bronze['humidity']}")
+                silver = create_silver_reading_backfill(
+                    bronze,
+                    {"dew_point_c": dew_points_c[idx], "dew_point_f": dew_points_f[idx]},
+                    COMFORT_CATEGORIES[comfort_codes[idx]],
+                    pressure_trend,
+                    daily_stats.stats()
+                )
+                
+                stats["processed"] += 1
+                
+                # Queue for writing to S3 (unless dry run or already written before)
+                if resume_after is not None and bronze["ts"] <= resume_after:
+                    stats["skipped"] += 1
+                elif not dry_run:
+                    if pending and pending[-1]["ts"][:10] != silver["ts"][:10]:
+                        flush_day()
+                    pending.append(silver)
+                
+                # Progress indicator
+                if (idx + 1) % 100 == 0 or (idx + 1) == len(bronze_readings):
+                    progress = (idx + 1) / len(bronze_readings) * 100
+                    print(f"Progress: {idx + 1}/{len(bronze_readings)} ({progress:.1f}%) - "
+                          f"Latest: {bronze['ts']}", end='\r')
             
-            # Progress indicator
-            if (idx + 1) % 100 == 0 or (idx + 1) == len(bronze_readings):
-                progress = (idx + 1) / len(bronze_readings) * 100
-                print(f"Progress: {idx + 1}/{len(bronze_readings)} ({progress:.1f}%) - "
-                      f"Latest: {bronze['ts']}", end='\r')
+            except Exception as e:
+                print(f"\n⚠️  Error processing reading {bronze.get('ts', 'unknown')}: {e}")
+                stats["errors"] += 1
+                continue
+        
+        flush_day()
+    finally:
+        executor.shutdown(wait=True)
+    
+    print()  # New line after progress indicator
+    
+    # Rewritten silver days that are already finished need their compacted file
+    # refreshed, and every rewritten day needs its gold rollups rebuilt. A resumed
+    # run redoes this for the whole period since the interrupted run may not have.
+    if not dry_run and (stats["written"] or stats["skipped"]):
+        # The current date, not end_time: a resumed run (or one that crossed
+        # midnight) has days the API already compacted from the old silver
+        today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        for date_str in sorted(backfill_dates):
+            if date_str >= today_str:
+                continue
+            try:
+                count = compact_day(settings.s3_silver_prefix, date_str)
+                print(f"🗜️  Compacted silver {date_str}: {count} readings")
+            except Exception as e:
+                print(f"⚠️  Error compacting silver {date_str}: {e}")
+                stats["errors"] += 1
         
+        try:
+            for date_str, count in rebuild_gold_days(sorted(backfill_dates)).items():
+                print(f"🥇 Rebuilt gold rollups {date_str}: {count} readings")
         except Exception as e:
-            print(f"\n⚠️  Error processing reading {bronze.get('ts', 'unknown')}: {e}")
+            print(f"⚠️  Error rebuilding gold rollups: {e}")
             stats["errors"] += 1
-            continue
+        
+        # The API's hot tier still has the old silver readings; make it reload them
+        if hot_tier.enabled:
+            try:
+                hot_tier.invalidate()
+                print("🔥 Hot tier invalidated, it is rebuilt on the API's next sync")
+            except Exception as e:
+                print(f"⚠️  Error invalidating hot tier {hot_tier.path}: {e}")
+                stats["errors"] += 1
+    
+    # Nothing left to resume; a later --resume starts a fresh run
+    if not dry_run and stats["errors"] == 0:
+        checkpoint_path.unlink(missing_ok=True)
     
-    print()  # New line after progress indicator
     return stats
 
 
@@ -237,6 +420,9 @@ Examples:
   
   # Backfill entire history (max 30 days)
   python backfill_silver.py --days 30
+  
+  # Continue a run that was interrupted, with 32 parallel uploads
+  python backfill_silver.py --days 30 --resume --workers 32
         """
     )
     
@@ -253,6 +439,26 @@ Examples:
         help='Preview without writing to S3'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=16,
+        help='Number of concurrent silver uploads (default: 16)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue from the checkpoint left by an interrupted run'
+    )
+    
+    parser.add_argument(
+        '--checkpoint',
+        type=Path,
+        default=DEFAULT_CHECKPOINT,
+        help=f'Checkpoint file (default: {DEFAULT_CHECKPOINT.name} next to this script)'
+    )
+    
     args = parser.parse_args()
     
     # Validate
@@ -260,13 +466,27 @@ Examples:
         print("❌ Error: --days must be between 1 and 30")
         return 1
     
+    if args.workers < 1:
+        print("❌ Error: --workers must be at least 1")
+        return 1
+    
     print("=" * 70)
     print("  SILVER LAYER BACKFILL TOOL")
     print("=" * 70)
     print()
     
     # Run backfill
-    stats = backfill_silver_layer(args.days, args.dry_run)
+    try:
+        stats = backfill_silver_layer(
+            args.days,
+            args.dry_run,
+            workers=args.workers,
+            resume=args.resume,
+            checkpoint_path=args.checkpoint
+        )
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
     
     # Print summary
     print()
@@ -276,16 +496,17 @@ Examples:
     print(f"Total readings:     {stats['total']}")
     print(f"Processed:          {stats['processed']}")
     print(f"Written to silver:  {stats['written']}")
+    print(f"Skipped (resumed):  {stats['skipped']}")
     print(f"Errors:             {stats['errors']}")
     
     if args.dry_run:
         print()
         print("✅ Dry run completed successfully!")
-        print("   Run without --dry-run to write to S3")
+        print("   Run without --dry-run to write to storage")
     else:
         print()
         print("✅ Backfill completed successfully!")
-        print(f"   Silver layer updated: s3://{settings.s3_bucket}/{settings.s3_silver_prefix}/")
+        print(f"   Silver layer updated: {storage_location()}/{settings.s3_silver_prefix}/")
     
     return 0 if stats['errors'] == 0 else 1
 
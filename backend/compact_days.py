@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compact finished days of the bronze and silver layers.
+
+Each reading is stored as its own small S3 object. This script combines every
+finished UTC day into a single gzipped NDJSON file per layer:
+
+    samples/compacted/YYYY-MM-DD.ndjson.gz
+    silver/compacted/YYYY-MM-DD.ndjson.gz
+
+Readers use the compacted file for past days and only fall back to the raw
+objects for today. The API compacts yesterday automatically after midnight;
+this script is for catching up on older days.
+
+Usage:
+    python compact_days.py --days 7          # Compact the last 7 finished days
+    python compact_days.py --days 3 --force  # Rebuild even if already compacted
+"""
+
+import argparse
+
+from src.weather.s3 import compact_finished_days, storage_location
+from src.weather.settings import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compact finished days of bronze and silver readings"
+    )
+
+    parser.add_argument(
+        '--days',
+        type=int,
+        required=True,
+        help='Number of finished days (before today) to compact (1-90)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Recompact days that already have a compacted file'
+    )
+
+    args = parser.parse_args()
+
+    if args.days < 1 or args.days > 90:
+        print("❌ Error: --days must be between 1 and 90")
+        return 1
+
+    print(f"🗜️  Compacting last {args.days} finished day(s) in {storage_location()}/")
+    print(f"Layers: {settings.s3_prefix}/, {settings.s3_silver_prefix}/")
+    print()
+
+    try:
+        written = compact_finished_days(days=args.days, force=args.force)
+    except Exception as e:
+        print(f"❌ Compaction failed: {e}")
+        return 1
+
+    for key, count in written.items():
+        print(f"  ✓ {key}: {count} readings")
+
+    print()
+    print(f"✅ Compacted {len(written)} file(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,12 +1,60 @@
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from .collector import read_measurement, create_silver_reading
+from fastapi.responses import JSONResponse, StreamingResponse
+from .collector import (
+    read_interval_measurement,
+    get_sensor_snapshot,
+    refresh_sensor_snapshot,
+    create_silver_reading,
+    seed_state,
+    get_daily_stats,
+    sampler
+)
 from .settings import settings
-from .s3 import get_readings_last_n_hours, get_latest_reading_from_s3, put_json_reading, put_silver_reading
+from .s3 import (
+    get_readings_last_n_hours,
+    get_latest_reading_from_s3,
+    latest_reading_ts,
+    record_latest_reading,
+    recorded_reading_ts,
+    compact_finished_days,
+    sync_hot_tier
+)
+from .gold import get_history_at_resolution, parse_resolution
+from .spool import spool
+from .events import broadcaster
+from .hot import hot_tier
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import partial
 import asyncio
+import hashlib
+import json
 
 app = FastAPI()
 
+# Blocking boto3 calls run on a dedicated pool so they never stall the event loop.
+# The Sense HAT gets its own single thread so I2C reads are never interleaved.
+_io_executor = ThreadPoolExecutor(max_workers=settings.io_workers, thread_name_prefix="weather-io")
+_sensor_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="weather-sensor")
+
+_upload_task: asyncio.Task | None = None
+_snapshot_task: asyncio.Task | None = None
+_hot_sync_task: asyncio.Task | None = None
+
+
+async def run_io(fn, *args, **kwargs):
+    """Run a blocking storage call on the I/O executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(fn, *args, **kwargs))
+
+
+async def run_sensor(fn, *args, **kwargs):
+    """Run a blocking sensor call on the sensor thread."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sensor_executor, partial(fn, *args, **kwargs))
+
 # Configure CORS to allow frontend to communicate with backend
 # Allows local development and any IP access (for Raspberry Pi deployment)
 app.add_middleware(
@@ -20,64 +68,189 @@ app.add_middleware(
 @app.on_event("startup")
 async def start():
     """
-    Background task that uploads sensor readings to S3 every 15 minutes.
-    Writes to both bronze (raw) and silver (enriched) layers.
+    Background task that samples the sensor every SAMPLE_INTERVAL_SEC.
+    Bronze (raw) and silver (enriched) readings are committed to the local
+    spool, whose flusher thread uploads them to S3 and updates the gold layer.
+    New readings and live /current snapshots are pushed to /stream clients,
+    and written to the local hot tier that serves /history.
     """
+    global _upload_task, _snapshot_task, _hot_sync_task
+    
+    spool.start()
+    sampler.start()
+    
     async def upload_loop():
+        try:
+            await run_io(seed_state)
+        except Exception as e:
+            print(f"Error seeding collector state: {e}", flush=True)
+        
+        last_compaction_date = None
         while True:
             try:
-                # Read raw measurement (bronze)
-                bronze = read_measurement()
-                put_json_reading(bronze)
-                print(f"Bronze uploaded: {bronze['ts']}", flush=True)
+                # Aggregate the interval's sensor samples into one raw measurement (bronze)
+                bronze = await run_sensor(read_interval_measurement)
                 
-                # Create and upload enriched silver reading
-                silver = create_silver_reading(bronze)
-                put_silver_reading(silver)
-                print(f"Silver uploaded: {silver['ts']}", flush=True)
+                # Create the enriched silver reading and spool both for upload
+                silver = await run_io(create_silver_reading, bronze)
+                await run_io(spool.enqueue, bronze, silver)
+                print(f"Reading spooled: {silver['ts']}", flush=True)
+                
+                # History is served from the hot tier right away, before the spool uploads
+                if hot_tier.enabled:
+                    try:
+                        await run_io(hot_tier.add, silver)
+                    except Exception as e:
+                        # The tier would have a hole in it; serve history from storage until it is rebuilt
+                        print(f"Error writing reading to hot tier: {e}", flush=True)
+                        await run_io(hot_tier.invalidate)
+                
+                # /latest serves it (and its validators move) without waiting for the upload
+                record_latest_reading(silver)
+                
+                # Published once the hot tier has it, so clients refetching /history on this event see it
+                broadcaster.publish("reading", silver)
+            except Exception as e:
+                print(f"Error recording reading: {e}", flush=True)
+            
+            # Once per UTC day, fold yesterday's raw objects into one compacted file per layer.
+            # Wait until the spool is drained so no spooled reading misses the compacted file.
+            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            if today != last_compaction_date and await run_io(spool.pending) == 0:
+                try:
+                    written = await run_io(compact_finished_days, days=1)
+                    last_compaction_date = today
+                    for key, count in written.items():
+                        print(f"Compacted {key}: {count} readings", flush=True)
+                except Exception as e:
+                    print(f"Error compacting finished days: {e}", flush=True)
+            await asyncio.sleep(settings.sample_interval_sec)
+    
+    async def snapshot_loop():
+        # Only does work while someone is listening
+        while True:
+            await asyncio.sleep(settings.stream_current_interval_sec)
+            if broadcaster.subscriber_count == 0:
+                continue
+            try:
+                broadcaster.publish("current", await _current_reading(settings.stream_current_interval_sec))
+            except Exception as e:
+                print(f"Error publishing current reading: {e}", flush=True)
+    
+    async def hot_sync():
+        # Picks up readings written by other processes, rebuilds after a backfill
+        # invalidated the tier, and retries a sync that failed
+        while True:
+            try:
+                await run_io(sync_hot_tier, spool.pending_readings)
             except Exception as e:
-                print(f"Error uploading to S3: {e}", flush=True)
+                print(f"Error syncing hot tier: {e}", flush=True)
             await asyncio.sleep(settings.sample_interval_sec)
     
-    asyncio.create_task(upload_loop())
+    _upload_task = asyncio.create_task(upload_loop())
+    _snapshot_task = asyncio.create_task(snapshot_loop())
+    _hot_sync_task = asyncio.create_task(hot_sync())
 
-@app.get("/latest")
-def get_latest():
+@app.on_event("shutdown")
+async def stop():
+    """Stop the background loops and spool flusher and release the executor threads."""
+    for task in (_upload_task, _snapshot_task, _hot_sync_task):
+        if task is not None:
+            task.cancel()
+    await run_io(spool.stop)
+    await run_io(sampler.stop)
+    _io_executor.shutdown(wait=False, cancel_futures=True)
+    _sensor_executor.shutdown(wait=False, cancel_futures=True)
+
+def _parse_ts(ts: str) -> datetime:
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def _validators(*parts, last_modified: datetime) -> dict:
+    """ETag / Last-Modified headers for a response determined entirely by `parts`."""
+    digest = hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:20]
+    return {
+        "ETag": f'W/"{digest}"',
+        "Last-Modified": format_datetime(last_modified.astimezone(timezone.utc).replace(microsecond=0), usegmt=True),
+        # Let browsers keep the response but revalidate it on every poll
+        "Cache-Control": "no-cache",
+    }
+
+
+def _not_modified(request: Request, headers: dict) -> bool:
+    """Evaluate If-None-Match (or, without it, If-Modified-Since) against our validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = headers["ETag"].removeprefix("W/")
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return parsedate_to_datetime(headers["Last-Modified"]) <= since
+    return False
+
+
+def _latest_validators(newest_ts: str) -> dict:
+    # Daily stats also advance with readings that are still waiting in the spool
+    return _validators("latest", newest_ts, get_daily_stats(), last_modified=_parse_ts(newest_ts))
+
+
+def _history_newest_ts(hours: int, seconds: int | None) -> str | None:
     """
-    Get the most recent weather reading from S3 silver layer.
-    This represents the last stored measurement with calculated metrics.
-    Daily stats are recalculated fresh from today's data from the silver layer.
+    ts of the newest reading a /history response would be built from.
+    
+    The hot tier already has readings the spool hasn't uploaded; whole-hour and
+    whole-day resolutions come from gold and storage, which only have uploaded ones.
+    """
+    from_gold = seconds is not None and seconds % 3600 == 0
+    if not from_gold and hot_tier.covers(hours):
+        return hot_tier.newest_ts() or latest_reading_ts()
+    return latest_reading_ts()
+
+
+def _history_validators(newest_ts: str, params: tuple) -> dict:
+    """
+    Validators for a /history window ending now.
+    
+    The window also slides as time passes: roughly every sample interval its
+    oldest reading drops out, so the number of intervals since the newest
+    reading is part of the tag.
     """
-    from datetime import datetime, timezone
+    newest = _parse_ts(newest_ts)
+    interval = max(1, settings.sample_interval_sec)
+    steps = max(0, int((datetime.now(timezone.utc) - newest).total_seconds()) // interval)
+    return _validators(
+        "history", newest_ts, steps, params,
+        last_modified=newest + timedelta(seconds=steps * interval)
+    )
+
+
+def _build_latest() -> dict:
+    """Blocking part of /latest: fetch the newest reading and attach daily stats."""
     from .calculations import calculate_daily_stats
     
     reading = get_latest_reading_from_s3()
     if reading is None:
         return {"error": "No readings found in S3"}
     
-    # Recalculate daily stats from today's silver data (not bronze)
-    # Silver data is already processed and more complete
-    current_time = datetime.now(timezone.utc)
-    today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Fetch last 24 hours to ensure we get all of today's readings
-    # (We'll filter to today after fetching)
-    todays_readings = get_readings_last_n_hours(hours=24)
-    
-    # Filter to only today's readings
-    today_str = today_start.strftime("%Y-%m-%d")
-    print(f"Looking for readings from today: {today_str}", flush=True)
-    print(f"Fetched {len(todays_readings)} total readings", flush=True)
-    
-    # Show sample timestamps for debugging
-    if todays_readings:
-        print(f"Sample timestamps: {[r['ts'][:10] for r in todays_readings[:5]]}", flush=True)
-    
-    todays_readings = [r for r in todays_readings if r["ts"].startswith(today_str)]
-    print(f"After filtering to today: {len(todays_readings)} readings", flush=True)
-    
-    # Calculate and update daily stats
-    daily_stats = calculate_daily_stats(todays_readings)
+    # Daily stats come from the running accumulator kept by the upload loop.
+    # If it is not available yet, recalculate from today's silver data.
+    daily_stats = get_daily_stats()
+    if daily_stats is None:
+        current_time = datetime.now(timezone.utc)
+        today_str = current_time.strftime("%Y-%m-%d")
+        
+        # Fetch last 24 hours to ensure we get all of today's readings
+        # (We'll filter to today after fetching)
+        todays_readings = get_readings_last_n_hours(hours=24)
+        todays_readings = [r for r in todays_readings if r["ts"].startswith(today_str)]
+        print(f"Recalculated daily stats from {len(todays_readings)} silver readings", flush=True)
+        daily_stats = calculate_daily_stats(todays_readings)
     reading.update(daily_stats)
     
     # Debug logging
@@ -85,39 +258,162 @@ def get_latest():
     
     return reading
 
+@app.get("/latest")
+async def get_latest(request: Request, response: Response):
+    """
+    Get the most recent weather reading from S3 silver layer.
+    This represents the last stored measurement with calculated metrics.
+    Daily stats are refreshed from today's running totals.
+    
+    Responses carry ETag/Last-Modified. Once this process has recorded a reading,
+    a matching If-None-Match or If-Modified-Since is answered with 304 without
+    touching S3.
+    """
+    newest_ts = recorded_reading_ts()
+    if newest_ts is not None:
+        headers = _latest_validators(newest_ts)
+        if _not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+    
+    reading = await run_io(_build_latest)
+    if "ts" in reading:
+        response.headers.update(_latest_validators(reading["ts"]))
+    return reading
+
 @app.get("/current")
-def get_current():
+async def get_current(
+    max_age: float = Query(default=10, ge=0, description="Oldest sensor sample to accept, in seconds (0 forces a fresh read)")
+):
     """
-    Get a real-time reading directly from the sensor with calculated metrics.
-    This reading is NOT stored in S3 - it's captured at the moment of the request.
+    Get a real-time reading with calculated metrics. This reading is NOT stored in S3.
+    
+    Served from the sampler thread's latest sample when it is at most `max_age`
+    seconds old; otherwise the sensor is read once on the sensor thread. Metrics
+    come from in-memory state only, so this never waits on S3.
     """
     try:
-        bronze = read_measurement()
-        silver = create_silver_reading(bronze)
-        return silver
+        return await _current_reading(max_age)
     except Exception as e:
         return {"error": f"Failed to read sensor: {str(e)}"}
 
+
+async def _current_reading(max_age: float) -> dict:
+    """Enriched sensor snapshot at most `max_age` seconds old (see /current)."""
+    snapshot = get_sensor_snapshot(max_age)
+    if snapshot is None:
+        snapshot = await run_sensor(refresh_sensor_snapshot, max_age)
+    bronze, taken_at = snapshot
+    silver = create_silver_reading(bronze, record=False)
+    silver["age_sec"] = round((datetime.now(timezone.utc) - taken_at).total_seconds(), 3)
+    return silver
+
+
+@app.get("/stream")
+async def stream():
+    """
+    Server-sent events with live data, replacing polling of /latest and /current.
+    
+    Events:
+        reading: Each new silver reading as soon as it is recorded
+        current: An enriched sensor snapshot every STREAM_CURRENT_INTERVAL_SEC
+    
+    The last event of each type is sent right after connecting.
+    """
+    return StreamingResponse(
+        broadcaster.stream(),
+        media_type="text/event-stream",
+        # Tell nginx not to buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _project(readings: list[dict], fields: list[str]) -> list[dict]:
+    """Keep only ts and the requested fields of each reading."""
+    keep = ["ts"] + [f for f in fields if f != "ts"]
+    return [{f: r[f] for f in keep if f in r} for r in readings]
+
+
+def _to_columns(readings: list[dict], fields: list[str] | None) -> dict[str, list]:
+    """
+    Turn reading dicts into one array per field.
+    
+    Columns are ts plus the requested fields (or every field seen, in first-seen
+    order). Readings missing a field get null in that column.
+    """
+    if fields is not None:
+        names = ["ts"] + [f for f in fields if f != "ts"]
+    else:
+        names = list(dict.fromkeys(f for r in readings for f in r))
+    return {name: [r.get(name) for r in readings] for name in names}
+
+
 @app.get("/history")
-def get_history(
-    hours: int = Query(default=24, ge=1, le=168, description="Number of hours to look back (1-168)")
+async def get_history(
+    request: Request,
+    hours: int = Query(default=24, ge=1, le=168, description="Number of hours to look back (1-168)"),
+    resolution: str | None = Query(default=None, description="Bucket size for server-side aggregation, e.g. 5m, 1h, 1d"),
+    format: str = Query(default="rows", pattern="^(rows|columnar)$", description="rows (list of readings) or columnar (one array per field)"),
+    fields: str | None = Query(default=None, description="Comma-separated fields to return, e.g. temp_f,humidity (ts is always included)")
 ):
     """
     Retrieve weather readings from the last N hours.
     
     Args:
         hours: Number of hours to look back (default: 24, max: 168/7 days)
+        resolution: Optional bucket size (1m-1d). Each row then has the bucket start
+            as ts, a count, the mean of every metric and <metric>_min / <metric>_max.
+            Whole hours and days are served from the gold layer rollups.
+        format: "rows" returns readings as a list of objects. "columnar" returns
+            them under "columns" as {field: [values...]}, which avoids repeating
+            every field name per reading.
+        fields: Optional projection; only these fields (plus ts) are returned.
+    
+    Responses carry ETag/Last-Modified derived from the newest reading the
+    response is built from (the hot tier includes readings still in the spool)
+    and the query, so a poll with nothing new is answered with 304 before any
+    S3 work.
     
     Returns:
         Readings sorted by timestamp (oldest first).
     """
+    seconds = None
+    if resolution is not None:
+        try:
+            seconds = parse_resolution(resolution)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    params = (hours, resolution, format, field_list)
+    
+    newest_ts = await run_io(_history_newest_ts, hours, seconds)
+    headers = None
+    if newest_ts is not None:
+        headers = _history_validators(newest_ts, params)
+        if _not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+    
     try:
-        readings = get_readings_last_n_hours(hours)
-        return {
-            "hours": hours,
-            "count": len(readings),
-            "readings": readings
-        }
+        if resolution is not None:
+            readings = await run_io(get_history_at_resolution, hours, seconds)
+        else:
+            readings = await run_io(get_readings_last_n_hours, hours)
+        
+        body = {"hours": hours}
+        if resolution is not None:
+            body["resolution"] = resolution
+        body["count"] = len(readings)
+        if format == "columnar":
+            body["format"] = "columnar"
+            body["columns"] = _to_columns(readings, field_list)
+        else:
+            body["readings"] = _project(readings, field_list) if field_list else readings
+        
+        # A reading written during the fetch may or may not be in the body, so
+        # don't let clients revalidate against the older tag
+        if newest_ts != await run_io(_history_newest_ts, hours, seconds):
+            headers = None
+        
+        # Readings are plain parsed JSON, so skip FastAPI's per-value encoding pass
+        return JSONResponse(body, headers=headers)
     except Exception as e:
         print(f"Error retrieving {hours}h history: {e}", flush=True)
         return {
@@ -0,0 +1,80 @@
+"""
+In-process read-through cache for parsed S3 objects.
+
+Objects can be rewritten by other processes (a backfill rewrites silver readings,
+recompaction rewrites compacted days), so callers key entries by object key and
+ETag, or revalidate them against the stored ETag, rather than trusting a key alone.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache bounded by entry count and total size.
+
+    Sizes are supplied by the caller (the raw object size in bytes is a good proxy).
+    When either budget is exceeded the least recently used entries are evicted.
+    A budget of 0 disables the cache entirely.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int):
+        """Insert or replace a value, evicting old entries to stay within budget."""
+        if not self.enabled or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def invalidate(self, key: str):
+        """Drop a single key from the cache if present."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return a snapshot of cache usage counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -72,6 +72,20 @@ def calculate_pressure_trend(current_reading: dict, historical_readings: list[di
         if 5.5 <= hours_ago <= 6.5 and pressure_6h_ago is None:
             pressure_6h_ago = reading["pressure"]
     
+    return summarize_pressure_trend(current_pressure, pressure_3h_ago, pressure_6h_ago)
+
+
+def summarize_pressure_trend(
+    current_pressure: float,
+    pressure_3h_ago: Optional[float],
+    pressure_6h_ago: Optional[float]
+) -> dict:
+    """
+    Build the pressure trend metrics from the pressures found ~3h and ~6h ago.
+    
+    Shared by calculate_pressure_trend and callers that locate the past
+    readings themselves (e.g. a sliding window over sorted readings).
+    """
     # Calculate trends (positive = rising, negative = falling)
     trend_3h = round(current_pressure - pressure_3h_ago, 2) if pressure_3h_ago else None
     trend_6h = round(current_pressure - pressure_6h_ago, 2) if pressure_6h_ago else None
@@ -99,6 +113,97 @@ def calculate_pressure_trend(current_reading: dict, historical_readings: list[di
     }
 
 
+class MetricAccumulator:
+    """
+    Running count, sum, min and max for a fixed set of numeric fields.
+    
+    Readings are folded in one at a time, so statistics over a growing set of
+    readings cost O(1) per reading instead of a rescan.
+    """
+    
+    def __init__(self, fields: tuple[str, ...]):
+        self.fields = tuple(fields)
+        self.count = {f: 0 for f in self.fields}
+        self.total = {f: 0.0 for f in self.fields}
+        self.min: dict[str, Optional[float]] = {f: None for f in self.fields}
+        self.max: dict[str, Optional[float]] = {f: None for f in self.fields}
+    
+    def add(self, reading: dict):
+        """Fold one reading in. Missing or None fields are skipped."""
+        for f in self.fields:
+            value = reading.get(f)
+            if value is None:
+                continue
+            self.count[f] += 1
+            self.total[f] += value
+            if self.min[f] is None or value < self.min[f]:
+                self.min[f] = value
+            if self.max[f] is None or value > self.max[f]:
+                self.max[f] = value
+    
+    def mean(self, field: str) -> Optional[float]:
+        return self.total[field] / self.count[field] if self.count[field] else None
+    
+    def copy(self) -> "MetricAccumulator":
+        clone = MetricAccumulator(self.fields)
+        clone.count = dict(self.count)
+        clone.total = dict(self.total)
+        clone.min = dict(self.min)
+        clone.max = dict(self.max)
+        return clone
+    
+    def merge(self, other: "MetricAccumulator"):
+        """Fold another accumulator's totals into this one (fields must match)."""
+        for f in self.fields:
+            if not other.count.get(f):
+                continue
+            self.count[f] += other.count[f]
+            self.total[f] += other.total[f]
+            if self.min[f] is None or other.min[f] < self.min[f]:
+                self.min[f] = other.min[f]
+            if self.max[f] is None or other.max[f] > self.max[f]:
+                self.max[f] = other.max[f]
+    
+    def to_dict(self) -> dict:
+        """Serialize to {field: {count, sum, min, max}} (JSON friendly)."""
+        return {
+            f: {"count": self.count[f], "sum": self.total[f], "min": self.min[f], "max": self.max[f]}
+            for f in self.fields
+        }
+    
+    @classmethod
+    def from_dict(cls, fields: tuple[str, ...], data: dict) -> "MetricAccumulator":
+        """Inverse of to_dict. Fields missing from data start empty."""
+        acc = cls(fields)
+        for f in acc.fields:
+            entry = data.get(f)
+            if not entry:
+                continue
+            acc.count[f] = entry["count"]
+            acc.total[f] = entry["sum"]
+            acc.min[f] = entry["min"]
+            acc.max[f] = entry["max"]
+        return acc
+
+
+DAILY_STATS_FIELDS = ("temp_f", "humidity", "pressure")
+
+
+def _daily_stats_from(acc: MetricAccumulator) -> dict:
+    temp_min = acc.min["temp_f"]
+    temp_max = acc.max["temp_f"]
+    temp_avg = acc.mean("temp_f")
+    humidity_avg = acc.mean("humidity")
+    pressure_avg = acc.mean("pressure")
+    return {
+        "daily_temp_min": round(temp_min, 1) if temp_min is not None else None,
+        "daily_temp_max": round(temp_max, 1) if temp_max is not None else None,
+        "daily_temp_avg": round(temp_avg, 1) if temp_avg is not None else None,
+        "daily_humidity_avg": round(humidity_avg, 1) if humidity_avg is not None else None,
+        "daily_pressure_avg": round(pressure_avg, 1) if pressure_avg is not None else None
+    }
+
+
 def calculate_daily_stats(todays_readings: list[dict]) -> dict:
     """
     Calculate rolling daily statistics from today's readings.
@@ -109,26 +214,64 @@ def calculate_daily_stats(todays_readings: list[dict]) -> dict:
     Returns:
         Dictionary with daily min/max/avg values
     """
-    if not todays_readings:
-        return {
-            "daily_temp_min": None,
-            "daily_temp_max": None,
-            "daily_temp_avg": None,
-            "daily_humidity_avg": None,
-            "daily_pressure_avg": None
-        }
+    acc = MetricAccumulator(DAILY_STATS_FIELDS)
+    for reading in todays_readings:
+        acc.add(reading)
+    return _daily_stats_from(acc)
+
+
+class DailyStatsAccumulator:
+    """
+    Incremental version of calculate_daily_stats for a single UTC day.
     
-    temps = [r["temp_f"] for r in todays_readings if "temp_f" in r]
-    humidities = [r["humidity"] for r in todays_readings if "humidity" in r]
-    pressures = [r["pressure"] for r in todays_readings if "pressure" in r]
+    Feed readings in oldest first as they arrive; the first reading of a new UTC
+    day resets the running totals. Readings no newer than the last one added are
+    ignored, so a reading that was also part of the seed data is not counted twice.
+    """
     
-    return {
-        "daily_temp_min": round(min(temps), 1) if temps else None,
-        "daily_temp_max": round(max(temps), 1) if temps else None,
-        "daily_temp_avg": round(sum(temps) / len(temps), 1) if temps else None,
-        "daily_humidity_avg": round(sum(humidities) / len(humidities), 1) if humidities else None,
-        "daily_pressure_avg": round(sum(pressures) / len(pressures), 1) if pressures else None
-    }
+    def __init__(self):
+        self.date: Optional[str] = None
+        self.last_ts: Optional[str] = None
+        self._acc = MetricAccumulator(DAILY_STATS_FIELDS)
+    
+    def reset(self, date: Optional[str] = None):
+        self.date = date
+        self.last_ts = None
+        self._acc = MetricAccumulator(DAILY_STATS_FIELDS)
+    
+    def add(self, reading: dict):
+        ts = reading["ts"]
+        if self.last_ts is not None and ts <= self.last_ts:
+            return
+        if self.date is not None and ts[:10] < self.date:
+            return
+        if ts[:10] != self.date:
+            self.reset(ts[:10])
+        self._acc.add(reading)
+        self.last_ts = ts
+    
+    def stats(self, date: Optional[str] = None) -> dict:
+        """
+        Return daily stats in the same shape as calculate_daily_stats.
+        
+        Args:
+            date: If given and it is not the day being accumulated, the stats
+                for an empty day are returned (e.g. just after midnight).
+        """
+        if date is not None and date != self.date:
+            return _daily_stats_from(MetricAccumulator(DAILY_STATS_FIELDS))
+        return _daily_stats_from(self._acc)
+    
+    def preview(self, reading: dict) -> dict:
+        """Return the stats as if `reading` were added, without recording it."""
+        date = reading["ts"][:10]
+        if self.last_ts is not None and reading["ts"] <= self.last_ts:
+            return self.stats()
+        if self.date is not None and date < self.date:
+            return self.stats()
+        acc = self._acc.copy() if date == self.date else MetricAccumulator(DAILY_STATS_FIELDS)
+        acc.add(reading)
+        return _daily_stats_from(acc)
 
 
 def get_comfort_index(temp_f: float, humidity: float, dew_point_f: float) -> str:
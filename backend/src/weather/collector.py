@@ -1,29 +1,109 @@
-import time, json
-from datetime import datetime, timezone
+import time, json, threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from .hat import get_sense, get_cpu_temp
-from .s3 import put_json_reading, put_silver_reading, get_readings_from_bronze
+from .sampler import SensorSampler
+from .s3 import get_readings_from_bronze, compact_finished_days
+from .spool import spool
 from .settings import settings
 from .calculations import (
     calculate_dew_point, 
     calculate_pressure_trend, 
-    calculate_daily_stats,
-    get_comfort_index
+    get_comfort_index,
+    DailyStatsAccumulator
 )
 
 sense = get_sense()
 
-# Track when we last calculated pressure trend
-_last_pressure_calc_time = None
+# The sampler thread and on-demand reads (e.g. /current) share the I2C bus
+_sensor_lock = threading.Lock()
 
-def read_measurement():
+# Pressure trends look back up to 6.5h, so keep a little more than that in memory
+PRESSURE_WINDOW_HOURS = 7
+
+# Recent (ts, pressure) samples, oldest first. The length cap is only a safety net;
+# entries are pruned by age as new readings arrive.
+_pressure_window: deque[dict] = deque(
+    maxlen=max(64, 2 * PRESSURE_WINDOW_HOURS * 3600 // max(1, settings.sample_interval_sec))
+)
+
+# Running min/max/avg for the current UTC day
+_daily_stats = DailyStatsAccumulator()
+
+# In-memory state is seeded from S3 once per process. _state_lock only guards
+# the in-memory structures; the S3 scan runs under _seed_lock so readers of the
+# state never wait on the network.
+_state_seeded = False
+_state_lock = threading.Lock()
+_seed_lock = threading.Lock()
+
+
+def _record_pressure(reading: dict):
+    """Append a reading to the pressure window and drop samples older than the window."""
+    if _pressure_window and reading["ts"] <= _pressure_window[-1]["ts"]:
+        return
+    _pressure_window.append({"ts": reading["ts"], "pressure": reading["pressure"]})
+    
+    newest = datetime.fromisoformat(reading["ts"].replace("Z", "+00:00"))
+    cutoff = (newest - timedelta(hours=PRESSURE_WINDOW_HOURS)).isoformat().replace("+00:00", "Z")
+    while _pressure_window and _pressure_window[0]["ts"] < cutoff:
+        _pressure_window.popleft()
+
+
+def seed_state():
+    """
+    Load recent bronze readings into the pressure window and daily stats accumulator.
+    
+    Runs at most once per process with a single S3 scan; later readings are
+    folded in as they are created.
+    """
+    global _state_seeded
+    
+    with _seed_lock:
+        if _state_seeded:
+            return
+        
+        current_time = datetime.now(timezone.utc)
+        today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        hours_since_midnight = (current_time - today_start).total_seconds() / 3600
+        hours = max(int(hours_since_midnight) + 1, PRESSURE_WINDOW_HOURS)
+        recent_readings = get_readings_from_bronze(hours=hours)
+        
+        today_str = today_start.strftime("%Y-%m-%d")
+        with _state_lock:
+            _daily_stats.reset(today_str)
+            _pressure_window.clear()
+            for reading in recent_readings:
+                if reading["ts"].startswith(today_str):
+                    _daily_stats.add(reading)
+                if "pressure" in reading:
+                    _record_pressure(reading)
+            _state_seeded = True
+        print(f"Collector state seeded from {len(recent_readings)} bronze readings "
+              f"({len(_pressure_window)} in pressure window)", flush=True)
+
+
+def get_daily_stats() -> dict | None:
+    """
+    Today's running daily stats, or None if the accumulator has not been seeded.
     """
-    Read and calibrate sensor data (Bronze layer).
+    with _state_lock:
+        if not _state_seeded:
+            return None
+        return _daily_stats.stats(datetime.now(timezone.utc).strftime("%Y-%m-%d"))
+
+def _read_sensor() -> dict:
+    """
+    Take one calibrated, unrounded sample from the Sense HAT.
     Uses pressure sensor as base (more accurate than humidity sensor).
     Applies both static offset and dynamic CPU temperature compensation.
     """
     # Get all temperature readings
-    temp_from_humidity = sense.get_temperature_from_humidity()
-    temp_from_pressure = sense.get_temperature_from_pressure()
+    with _sensor_lock:
+        temp_from_humidity = sense.get_temperature_from_humidity()
+        temp_from_pressure = sense.get_temperature_from_pressure()
+        humidity = sense.get_humidity()
+        pressure = sense.get_pressure()
     
     # Use pressure sensor as base (typically more accurate for ambient temp)
     base_temp_c = temp_from_pressure
@@ -40,30 +120,113 @@ def read_measurement():
         calibrated_temp_c -= cpu_compensation
     
     return {
-        "ts": datetime.now(timezone.utc).isoformat().replace("+00:00","Z"),
-        "temp_c": round(calibrated_temp_c, 2),
-        "temp_f": round(1.8 * calibrated_temp_c + 32, 2),
-        "humidity": round(sense.get_humidity(), 2),
-        "pressure": round(sense.get_pressure(), 2),
+        "temp_c": calibrated_temp_c,
+        "humidity": humidity,
+        "pressure": pressure,
+        "temp_from_humidity": temp_from_humidity,
+        "temp_from_pressure": temp_from_pressure,
+        "cpu_temp": cpu_temp,
+    }
+
+
+def _bronze_from(values: dict, ts: datetime) -> dict:
+    """Round a sensor sample into the bronze record format."""
+    cpu_temp = values.get("cpu_temp")
+    return {
+        "ts": ts.isoformat().replace("+00:00","Z"),
+        "temp_c": round(values["temp_c"], 2),
+        "temp_f": round(1.8 * values["temp_c"] + 32, 2),
+        "humidity": round(values["humidity"], 2),
+        "pressure": round(values["pressure"], 2),
         # Debug/diagnostic fields
-        "temp_from_humidity": round(temp_from_humidity, 2),
-        "temp_from_pressure": round(temp_from_pressure, 2),
+        "temp_from_humidity": round(values["temp_from_humidity"], 2),
+        "temp_from_pressure": round(values["temp_from_pressure"], 2),
         "cpu_temp": round(cpu_temp, 2) if cpu_temp else None,
     }
 
 
-def create_silver_reading(bronze_reading: dict) -> dict:
+def read_measurement():
+    """
+    Read and calibrate sensor data (Bronze layer) from a single instantaneous sample.
+    """
+    return _bronze_from(_read_sensor(), datetime.now(timezone.utc))
+
+
+# Oversampling thread; SENSOR_SAMPLE_HZ=0 keeps the single-sample behaviour
+sampler = SensorSampler(_read_sensor, settings.sensor_sample_hz)
+
+# Fields whose spread within an interval is kept next to the median value
+SPREAD_FIELDS = ("temp_c", "humidity", "pressure")
+
+
+def read_interval_measurement() -> dict:
+    """
+    Bronze record summarizing every sample taken since the previous call.
+    
+    Main fields hold the median of the interval's samples (robust against single
+    noisy reads); temp_c, humidity and pressure also get <field>_mean, _min and
+    _max, and sample_count says how many samples went in. Falls back to
+    read_measurement() when the sampler is off or has no samples yet.
+    """
+    interval = sampler.take_interval()
+    if interval is None or not all(f in interval["fields"] for f in SPREAD_FIELDS):
+        return read_measurement()
+    
+    fields = interval["fields"]
+    bronze = _bronze_from(
+        {field: stats["median"] for field, stats in fields.items()},
+        interval["end"]
+    )
+    for field in SPREAD_FIELDS:
+        for stat in ("mean", "min", "max"):
+            bronze[f"{field}_{stat}"] = round(fields[field][stat], 2)
+    bronze["sample_count"] = interval["count"]
+    return bronze
+
+
+def get_sensor_snapshot(max_age: float | None = None) -> tuple[dict, datetime] | None:
+    """
+    The sampler's latest bronze-shaped sample and when it was taken.
+    
+    Never touches the sensor. Returns None if there is no sample yet or it is
+    older than `max_age` seconds.
+    """
+    latest = sampler.latest()
+    if latest is None:
+        return None
+    values, taken_at = latest
+    if max_age is not None and (datetime.now(timezone.utc) - taken_at).total_seconds() > max_age:
+        return None
+    return _bronze_from(values, taken_at), taken_at
+
+
+def refresh_sensor_snapshot(max_age: float | None = None) -> tuple[dict, datetime]:
+    """
+    Like get_sensor_snapshot, but read the sensor when there is no fresh enough sample.
+    
+    Callers queued behind one another on the sensor thread reuse the read made
+    by the first of them instead of each reading the sensor again.
+    """
+    snapshot = get_sensor_snapshot(max_age)
+    if snapshot is not None:
+        return snapshot
+    values, taken_at = sampler.refresh()
+    return _bronze_from(values, taken_at), taken_at
+
+
+def create_silver_reading(bronze_reading: dict, record: bool = True) -> dict:
     """
     Create enriched silver reading from bronze data with calculated metrics.
     
     Args:
         bronze_reading: Raw sensor reading from read_measurement()
+        record: Fold the reading into the running daily stats. Pass False for
+            readings that are not stored (e.g. /current); those are enriched
+            from whatever in-memory state exists and never trigger the S3 seed scan.
     
     Returns:
         Enriched reading with calculated metrics
     """
-    global _last_pressure_calc_time
-    
     # Start with bronze data
     silver = bronze_reading.copy()
     
@@ -78,68 +241,53 @@ def create_silver_reading(bronze_reading: dict) -> dict:
         dew_point["dew_point_f"]
     )
     
-    # 3. Calculate pressure trend (every 6 hours)
-    current_time = datetime.now(timezone.utc)
-    should_calc_pressure = (
-        _last_pressure_calc_time is None or 
-        (current_time - _last_pressure_calc_time).total_seconds() >= 6 * 3600
-    )
-    
-    if should_calc_pressure:
-        # Fetch last 7 hours of bronze data for pressure trend calculation
-        historical = get_readings_from_bronze(hours=7)
-        pressure_trend = calculate_pressure_trend(bronze_reading, historical)
-        _last_pressure_calc_time = current_time
-    else:
-        # Use previous values or None if not yet calculated
-        pressure_trend = {
-            "pressure_trend_3h": None,
-            "pressure_trend_6h": None,
-            "pressure_trend_label": "calculating"
-        }
+    # 3 & 4. Pressure trend and daily stats from in-memory state (including this reading)
+    if record:
+        seed_state()
+    with _state_lock:
+        pressure_trend = calculate_pressure_trend(bronze_reading, list(_pressure_window))
+        if record:
+            _record_pressure(bronze_reading)
+            _daily_stats.add(bronze_reading)
+            daily_stats = _daily_stats.stats()
+        else:
+            daily_stats = _daily_stats.preview(bronze_reading)
     
     silver.update(pressure_trend)
-    
-    # 4. Calculate daily stats (rolling calculation)
-    # Fetch today's bronze readings from S3
-    today_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    hours_since_midnight = (current_time - today_start).total_seconds() / 3600
-    todays_readings = get_readings_from_bronze(hours=int(hours_since_midnight) + 1)
-    
-    # Filter to only today's readings
-    today_str = today_start.strftime("%Y-%m-%d")
-    print(f"Daily stats calc: Looking for readings from {today_str}, found {len(todays_readings)} total readings", flush=True)
-    todays_readings = [r for r in todays_readings if r["ts"].startswith(today_str)]
-    print(f"After filtering to today: {len(todays_readings)} readings", flush=True)
-    
-    # Include the current reading in the daily stats (important for accuracy and early-day data)
-    todays_readings.append(bronze_reading)
-    print(f"After including current reading: {len(todays_readings)} readings", flush=True)
-    
-    daily_stats = calculate_daily_stats(todays_readings)
-    print(f"Calculated daily stats: {daily_stats}", flush=True)
     silver.update(daily_stats)
     
     return silver
 
 if __name__ == "__main__":
+    # Uploads happen on the spool's background thread, so S3 latency or outages
+    # never delay sampling
+    spool.start()
+    sampler.start()
+    last_compaction_date = None
     while True:
-        # Read raw measurement (Bronze)
-        bronze = read_measurement()
+        # Aggregate the interval's samples into one raw measurement (Bronze)
+        bronze = read_interval_measurement()
         print(f"Bronze: {json.dumps(bronze)}", flush=True)
         
         try:
-            # Write to bronze layer
-            put_json_reading(bronze)
-            print("✓ Bronze written", flush=True)
-            
-            # Create and write enriched silver reading
+            # Create the enriched silver reading and commit both to the local spool
             silver = create_silver_reading(bronze)
-            put_silver_reading(silver)
-            print(f"✓ Silver written (comfort: {silver.get('comfort_index')}, "
+            spool.enqueue(bronze, silver)
+            print(f"✓ Spooled (comfort: {silver.get('comfort_index')}, "
                   f"pressure_trend: {silver.get('pressure_trend_label')})", flush=True)
             
         except Exception as e:
-            print(f"S3 upload error: {e}", flush=True)
+            print(f"Spool error: {e}", flush=True)
+        
+        # Once per UTC day, compact yesterday's readings into one file per layer.
+        # Wait until the spool is drained so the compacted file is complete.
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if today != last_compaction_date and spool.pending() == 0:
+            try:
+                compact_finished_days(days=1)
+                last_compaction_date = today
+                print("✓ Finished days compacted", flush=True)
+            except Exception as e:
+                print(f"Compaction error: {e}", flush=True)
         
         time.sleep(settings.sample_interval_sec)
@@ -0,0 +1,67 @@
+"""
+In-process fan-out of live events to streaming clients.
+
+The API's upload loop publishes every new silver reading and a snapshot task
+publishes /current readings; each connected /stream client gets its own small
+queue, so one slow client never holds up the others or the publishers.
+"""
+import asyncio
+import json
+from typing import AsyncIterator
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class EventBroadcaster:
+    """
+    Publish/subscribe hub for server-sent events.
+
+    Must be used from the event loop thread. The last event of each type is
+    kept and replayed to new subscribers, so a client that just connected has
+    something to show before the next reading comes in.
+    """
+
+    def __init__(self, queue_size: int = 16):
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._last: dict[str, str] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: dict):
+        """Queue an event for every subscriber."""
+        message = format_sse(event, data)
+        self._last[event] = message
+        for queue in self._subscribers:
+            if queue.full():
+                # A client that stopped reading loses its oldest event
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def stream(self, keepalive_sec: float = 15) -> AsyncIterator[str]:
+        """
+        Yield encoded events for one subscriber until the client goes away.
+
+        A comment line is sent after `keepalive_sec` without events so proxies
+        don't close the idle connection.
+        """
+        queue: asyncio.Queue = asyncio.Queue(max(self.queue_size, len(self._last)))
+        for message in self._last.values():
+            queue.put_nowait(message)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), keepalive_sec)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self._subscribers.discard(queue)
+
+
+broadcaster = EventBroadcaster()
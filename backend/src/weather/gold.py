@@ -0,0 +1,388 @@
+"""
+Gold layer: hourly and daily rollups of silver readings.
+
+Layout:
+    gold/hourly/YYYY-MM-DD.json  - the hourly buckets of one UTC day
+    gold/daily/YYYY-MM.json      - the daily buckets of one UTC month
+
+Each bucket stores count/sum/min/max per metric so it can be updated one reading
+at a time and merged. rollup_rows() turns buckets into reading-shaped rows
+(mean per metric plus <metric>_min / <metric>_max) for charts and queries.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from .calculations import MetricAccumulator
+from .s3 import (
+    get_day_readings,
+    get_fetch_executor,
+    get_json_object,
+    get_manifest_or_none,
+    get_readings_last_n_hours,
+    update_json_object
+)
+from .settings import settings
+
+# Metrics rolled up into every bucket
+ROLLUP_FIELDS = (
+    "temp_c", "temp_f", "humidity", "pressure", "dew_point_c", "dew_point_f",
+    "temp_from_humidity", "temp_from_pressure"
+)
+
+
+def hourly_key(date: str) -> str:
+    return f"{settings.s3_gold_prefix}/hourly/{date}.json"
+
+
+def daily_key(month: str) -> str:
+    return f"{settings.s3_gold_prefix}/daily/{month}.json"
+
+
+def _hour_bucket(ts: str) -> str:
+    # "2025-10-06T20:15:03.123Z" -> "2025-10-06T20:00:00Z"
+    return f"{ts[:13]}:00:00Z"
+
+
+def _day_bucket(ts: str) -> str:
+    return f"{ts[:10]}T00:00:00Z"
+
+
+class _BucketSet:
+    """Rollup buckets keyed by bucket start timestamp, as stored in one gold object."""
+
+    def __init__(self, bucket_of):
+        self.bucket_of = bucket_of
+        self.buckets: dict[str, MetricAccumulator] = {}
+        self.counts: dict[str, int] = {}
+        self.last_ts: Optional[str] = None
+
+    def add(self, reading: dict):
+        bucket = self.bucket_of(reading["ts"])
+        if bucket not in self.buckets:
+            self.buckets[bucket] = MetricAccumulator(ROLLUP_FIELDS)
+            self.counts[bucket] = 0
+        self.buckets[bucket].add(reading)
+        self.counts[bucket] += 1
+        if self.last_ts is None or reading["ts"] > self.last_ts:
+            self.last_ts = reading["ts"]
+
+    def merge(self, other: "_BucketSet"):
+        """Fold another set's buckets into this set's (coarser) buckets, e.g. hours into days."""
+        for ts, acc in other.buckets.items():
+            bucket = self.bucket_of(ts)
+            if bucket not in self.buckets:
+                self.buckets[bucket] = MetricAccumulator(ROLLUP_FIELDS)
+                self.counts[bucket] = 0
+            self.buckets[bucket].merge(acc)
+            self.counts[bucket] += other.counts[ts]
+        if other.last_ts and (self.last_ts is None or other.last_ts > self.last_ts):
+            self.last_ts = other.last_ts
+
+    def replace(self, other: "_BucketSet"):
+        """Overwrite the buckets that `other` has (used when rebuilding days)."""
+        self.buckets.update(other.buckets)
+        self.counts.update(other.counts)
+        if other.last_ts and (self.last_ts is None or other.last_ts > self.last_ts):
+            self.last_ts = other.last_ts
+
+    def to_dict(self) -> dict:
+        return {
+            "last_ts": self.last_ts,
+            "buckets": [
+                {"ts": ts, "count": self.counts[ts], "metrics": self.buckets[ts].to_dict()}
+                for ts in sorted(self.buckets)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, bucket_of, data: Optional[dict]) -> "_BucketSet":
+        bucket_set = cls(bucket_of)
+        if not data:
+            return bucket_set
+        bucket_set.last_ts = data.get("last_ts")
+        for bucket in data.get("buckets", []):
+            bucket_set.buckets[bucket["ts"]] = MetricAccumulator.from_dict(ROLLUP_FIELDS, bucket["metrics"])
+            bucket_set.counts[bucket["ts"]] = bucket["count"]
+        return bucket_set
+
+
+def _fold_into(key: str, bucket_of, silver: dict, header: dict):
+    """Add a reading to a stored bucket object unless it already contains it."""
+    def fold(data: Optional[dict]) -> Optional[dict]:
+        bucket_set = _BucketSet.from_dict(bucket_of, data)
+        # Already folded in (before a restart, or by a rebuild from silver)
+        if bucket_set.last_ts is not None and silver["ts"] <= bucket_set.last_ts:
+            return None
+        bucket_set.add(silver)
+        return {**header, **bucket_set.to_dict()}
+    
+    update_json_object(key, fold)
+
+
+class GoldRollups:
+    """
+    Incrementally maintained gold objects for the day and month being written.
+    
+    Every reading re-reads the stored hourly and daily objects and writes them
+    back conditionally (see update_json_object), so a rebuild_gold_days run
+    from another process (backfill) is merged into, never overwritten with
+    stale totals.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+    
+    def add(self, silver: dict):
+        """Fold a silver reading into the rollups and write both gold objects."""
+        ts = silver["ts"]
+        date, month = ts[:10], ts[:7]
+        
+        with self._lock:
+            _fold_into(hourly_key(date), _hour_bucket, silver, {"date": date})
+            _fold_into(daily_key(month), _day_bucket, silver, {"month": month})
+
+
+_rollups = GoldRollups()
+
+
+def update_gold(silver: dict):
+    """Update the gold layer with a newly written silver reading."""
+    _rollups.add(silver)
+
+
+def rebuild_gold_days(dates: list[str]) -> dict[str, int]:
+    """
+    Recompute gold rollups for whole UTC days from the silver layer.
+
+    Hourly objects for the given days are replaced; their days inside the monthly
+    daily objects are replaced too, leaving other days of the month untouched.
+
+    Both are written conditionally, so a reading the API folds in meanwhile is
+    never overwritten: each hourly object is recomputed from silver read after
+    the object itself, and each day's daily bucket is summed from its hourly
+    object read after the daily one. A fold landing in between makes the write
+    fail and the update run again.
+
+    Returns:
+        Mapping of date -> number of silver readings rolled up.
+    """
+    counts = {}
+    dates_by_month: dict[str, list[str]] = {}
+
+    for date in sorted(set(dates)):
+        def rebuild_hours(data: Optional[dict], date=date) -> dict:
+            readings, errors = get_day_readings(settings.s3_silver_prefix, date)
+            if errors:
+                raise RuntimeError(f"Could not read {len(errors)} silver object(s) for {date}")
+            hourly = _BucketSet(_hour_bucket)
+            for reading in readings:
+                hourly.add(reading)
+            counts[date] = len(readings)
+            return {"date": date, **hourly.to_dict()}
+        update_json_object(hourly_key(date), rebuild_hours)
+        dates_by_month.setdefault(date[:7], []).append(date)
+
+    for month, month_dates in dates_by_month.items():
+        def replace_days(data: Optional[dict], month=month, month_dates=month_dates) -> dict:
+            rebuilt = _BucketSet(_day_bucket)
+            for date in month_dates:
+                rebuilt.merge(_BucketSet.from_dict(_hour_bucket, get_json_object(hourly_key(date))))
+            existing = _BucketSet.from_dict(_day_bucket, data)
+            existing.replace(rebuilt)
+            return {"month": month, **existing.to_dict()}
+        update_json_object(daily_key(month), replace_days)
+
+    return counts
+
+
+def rollup_rows(buckets: list[dict]) -> list[dict]:
+    """
+    Flatten stored buckets into reading-shaped rows.
+
+    Each row has ts (bucket start), count, the mean of every metric under the
+    metric's own name, and <metric>_min / <metric>_max.
+    """
+    rows = []
+    for bucket in buckets:
+        acc = MetricAccumulator.from_dict(ROLLUP_FIELDS, bucket["metrics"])
+        row = {"ts": bucket["ts"], "count": bucket["count"]}
+        for f in ROLLUP_FIELDS:
+            mean = acc.mean(f)
+            row[f] = round(mean, 2) if mean is not None else None
+            row[f"{f}_min"] = acc.min[f]
+            row[f"{f}_max"] = acc.max[f]
+        rows.append(row)
+    return rows
+
+
+def _fetch_buckets(keys: list[str]) -> list[dict]:
+    """GET gold objects concurrently and return all of their buckets, oldest first."""
+    buckets = []
+    for data in get_fetch_executor().map(get_json_object, keys):
+        if data:
+            buckets.extend(data.get("buckets", []))
+    buckets.sort(key=lambda b: b["ts"])
+    return buckets
+
+
+def get_hourly_buckets(hours: int = 24) -> list[dict]:
+    """
+    Stored hourly buckets covering the last N hours (one GET per UTC day).
+
+    The first bucket is the hour containing the cutoff, so it may include a few
+    readings from just before the window.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff_bucket = _hour_bucket((now - timedelta(hours=hours)).isoformat())
+    dates = []
+    day = (now - timedelta(hours=hours)).date()
+    while day <= now.date():
+        dates.append(day.isoformat())
+        day += timedelta(days=1)
+
+    buckets = _fetch_buckets([hourly_key(d) for d in dates])
+    return [b for b in buckets if b["ts"] >= cutoff_bucket]
+
+
+def get_daily_buckets(start_date: str, end_date: str) -> list[dict]:
+    """Stored daily buckets for an inclusive YYYY-MM-DD date range (one GET per month)."""
+    months = []
+    current = datetime.strptime(start_date[:7], "%Y-%m")
+    end = datetime.strptime(end_date[:7], "%Y-%m")
+    while current <= end:
+        months.append(current.strftime("%Y-%m"))
+        current = (current + timedelta(days=32)).replace(day=1)
+
+    buckets = _fetch_buckets([daily_key(m) for m in months])
+    return [b for b in buckets if start_date <= b["ts"][:10] <= end_date]
+
+
+def get_hourly_rollups(hours: int = 24) -> list[dict]:
+    """Hourly rollup rows covering the last N hours."""
+    return rollup_rows(get_hourly_buckets(hours))
+
+
+def get_daily_rollups(start_date: str, end_date: str) -> list[dict]:
+    """Daily rollup rows for an inclusive YYYY-MM-DD date range."""
+    return rollup_rows(get_daily_buckets(start_date, end_date))
+
+
+_RESOLUTION_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+
+def parse_resolution(resolution: str) -> int:
+    """
+    Convert a resolution like "5m", "1h" or "1d" to seconds.
+
+    Raises:
+        ValueError: If the format is wrong or the size is outside 1 minute to 1 day.
+    """
+    if len(resolution) < 2 or resolution[-1] not in _RESOLUTION_UNITS or not resolution[:-1].isdigit():
+        raise ValueError(f"Invalid resolution {resolution!r}, expected e.g. 5m, 1h or 1d")
+    seconds = int(resolution[:-1]) * _RESOLUTION_UNITS[resolution[-1]]
+    if not 60 <= seconds <= 86400:
+        raise ValueError(f"Resolution {resolution!r} must be between 1m and 1d")
+    return seconds
+
+
+def _aligned_bucket(seconds: int):
+    """Bucket function that floors timestamps to multiples of `seconds` since the epoch (UTC)."""
+    def bucket_of(ts: str) -> str:
+        t = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        start = int(t.timestamp()) // seconds * seconds
+        return datetime.fromtimestamp(start, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return bucket_of
+
+
+def _regroup(buckets: list[dict], seconds: int) -> list[dict]:
+    """Merge stored buckets into coarser buckets of `seconds` each."""
+    bucket_of = _aligned_bucket(seconds)
+    merged: dict[str, MetricAccumulator] = {}
+    counts: dict[str, int] = {}
+    for bucket in buckets:
+        ts = bucket_of(bucket["ts"])
+        acc = MetricAccumulator.from_dict(ROLLUP_FIELDS, bucket["metrics"])
+        if ts in merged:
+            merged[ts].merge(acc)
+            counts[ts] += bucket["count"]
+        else:
+            merged[ts] = acc
+            counts[ts] = bucket["count"]
+    return [
+        {"ts": ts, "count": counts[ts], "metrics": merged[ts].to_dict()}
+        for ts in sorted(merged)
+    ]
+
+
+def downsample_readings(readings: list[dict], seconds: int) -> list[dict]:
+    """Aggregate raw readings into rollup rows of `seconds` each (see rollup_rows)."""
+    bucket_set = _BucketSet(_aligned_bucket(seconds))
+    for reading in readings:
+        bucket_set.add(reading)
+    return rollup_rows(bucket_set.to_dict()["buckets"])
+
+
+def _day_buckets(date: str, gold_buckets: list[dict], manifest: Optional[list[dict]], bucket_of, first_bucket: str) -> list[dict]:
+    """
+    One day's buckets from or after `first_bucket`: the stored gold buckets if they
+    hold every silver reading the day's manifest lists, otherwise rebuilt from silver.
+    """
+    if manifest is not None:
+        expected = sum(1 for e in manifest if bucket_of(e["ts"]) >= first_bucket)
+        if sum(b["count"] for b in gold_buckets) == expected:
+            return gold_buckets
+    
+    # Gold doesn't cover the day (yet), e.g. right after deploy or a day never backfilled
+    start = datetime.fromisoformat(first_bucket.replace("Z", "+00:00"))
+    readings, errors = get_day_readings(settings.s3_silver_prefix, date, start=start)
+    for key, error in errors.items():
+        print(f"Error reading {key}: {error}", flush=True)
+    bucket_set = _BucketSet(bucket_of)
+    for reading in readings:
+        if bucket_of(reading["ts"]) >= first_bucket:
+            bucket_set.add(reading)
+    return bucket_set.to_dict()["buckets"]
+
+
+def get_history_at_resolution(hours: int, seconds: int) -> list[dict]:
+    """
+    Rollup rows for the last N hours at the requested bucket size.
+    
+    Whole-day and whole-hour resolutions are assembled from the gold layer
+    (one GET per month or per day), day by day: a day whose gold buckets don't
+    account for every reading in its silver manifest is aggregated from silver
+    instead. Finer resolutions are aggregated from the raw silver readings.
+    """
+    if seconds % 3600 != 0:
+        return downsample_readings(get_readings_last_n_hours(hours), seconds)
+    
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(hours=hours)
+    dates = []
+    day = start.date()
+    while day <= now.date():
+        dates.append(day.isoformat())
+        day += timedelta(days=1)
+    
+    if seconds % 86400 == 0:
+        bucket_of = _day_bucket
+        gold_buckets = get_daily_buckets(dates[0], dates[-1])
+    else:
+        bucket_of = _hour_bucket
+        gold_buckets = get_hourly_buckets(hours)
+    first_bucket = bucket_of(start.isoformat())
+    
+    gold_by_date: dict[str, list[dict]] = {}
+    for bucket in gold_buckets:
+        gold_by_date.setdefault(bucket["ts"][:10], []).append(bucket)
+    manifests = get_fetch_executor().map(
+        lambda date: get_manifest_or_none(settings.s3_silver_prefix, date), dates
+    )
+    
+    buckets = []
+    for date, manifest in zip(dates, manifests):
+        day_first = max(first_bucket, bucket_of(f"{date}T00:00:00Z"))
+        buckets.extend(_day_buckets(date, gold_by_date.get(date, []), manifest, bucket_of, day_first))
+    buckets.sort(key=lambda b: b["ts"])
+    return rollup_rows(_regroup(buckets, seconds))
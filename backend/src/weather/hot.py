@@ -0,0 +1,133 @@
+"""
+Local hot tier: the last HOT_TIER_DAYS of silver readings in SQLite.
+
+Readings are indexed by epoch seconds, so a /history window is one indexed range
+query instead of a scan over many storage objects. The object store stays the
+durable copy: the hot tier is topped up from it periodically and can be
+deleted at any time.
+
+The tier records a "synced through" watermark once a sync has copied every
+reading up to that time without errors. It only answers queries while the
+watermark is set, the next sync starts from it, and tools that rewrite silver
+in storage (backfills) call `invalidate()` so the tier is rebuilt from scratch.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .settings import settings
+
+
+def _epoch(ts: str) -> float:
+    return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+
+
+class HotTier:
+    """
+    Time-indexed SQLite store for recent silver readings.
+
+    Queries are only answered while a sync watermark is set (see
+    `mark_synced()`), so a half-filled tier never returns partial history.
+    The watermark lives in the database, so another process can clear it.
+    """
+
+    def __init__(self, path: str, retention_days: float = 7):
+        self.path = path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention_days > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS readings ("
+                " ts TEXT PRIMARY KEY,"
+                " epoch REAL NOT NULL,"
+                " data TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS readings_epoch ON readings (epoch)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.commit()
+        return self._conn
+
+    def _cutoff(self) -> float:
+        return (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).timestamp()
+
+    def add_many(self, readings: list[dict]):
+        """Insert (or replace) readings and drop everything past the retention window."""
+        cutoff = self._cutoff()
+        rows = [
+            (r["ts"], epoch, json.dumps(r))
+            for r in readings
+            if (epoch := _epoch(r["ts"])) >= cutoff
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR REPLACE INTO readings (ts, epoch, data) VALUES (?, ?, ?)", rows)
+            conn.execute("DELETE FROM readings WHERE epoch < ?", (cutoff,))
+            conn.commit()
+
+    def add(self, reading: dict):
+        """Insert one new silver reading."""
+        self.add_many([reading])
+
+    def newest_ts(self) -> str | None:
+        """ts of the newest stored reading, or None if the tier is empty."""
+        with self._lock:
+            row = self._connect().execute("SELECT ts FROM readings ORDER BY epoch DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def clear(self):
+        """Drop every stored reading (before a full rebuild)."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM readings")
+            conn.commit()
+
+    def synced_through(self) -> datetime | None:
+        """Time up to which every reading in storage is known to be in the tier, or None."""
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = 'synced_through'").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def mark_synced(self, through: datetime):
+        """Record that every reading written before `through` has been copied in."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_through', ?)",
+                (through.isoformat(),)
+            )
+            conn.commit()
+
+    def invalidate(self):
+        """Stop serving queries until the next full rebuild, e.g. after silver was rewritten."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM meta WHERE key = 'synced_through'")
+            conn.commit()
+
+    def covers(self, hours: float) -> bool:
+        """Whether a window of the last `hours` can be answered from the hot tier."""
+        return self.enabled and hours <= self.retention_days * 24 and self.synced_through() is not None
+
+    def readings_since(self, start: datetime) -> list[dict]:
+        """Readings at or after `start`, oldest first."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT data FROM readings WHERE epoch >= ? ORDER BY epoch",
+                (start.timestamp(),)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+
+hot_tier = HotTier(settings.hot_tier_path, retention_days=settings.hot_tier_days)
@@ -1,41 +1,333 @@
-import json, time
+import gzip, json, random, re, threading, time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-import boto3
+from .cache import LRUCache
+from .hot import hot_tier
 from .settings import settings
+from .storage import PreconditionFailed, create_store
 
-# Create S3 client with explicit credentials from settings
-_s3 = boto3.client(
-    "s3",
-    aws_access_key_id=settings.aws_access_key_id,
-    aws_secret_access_key=settings.aws_secret_access_key,
-    region_name=settings.aws_region
+# Object store holding every layer (S3 bucket or local directory, see storage.py)
+_store = create_store()
+
+# Parsed copies of objects, cached by key and ETag (see cache.py)
+_reading_cache = LRUCache(
+    max_entries=settings.s3_cache_max_entries,
+    max_bytes=settings.s3_cache_max_bytes
 )
 
-def put_json_reading(d: dict):
-    """Write raw reading to bronze layer."""
+# Shared worker pool for fetching many objects at once (created on first use)
+_fetch_executor: ThreadPoolExecutor | None = None
+
+# Newest silver reading written by this process, so /latest needs no S3 calls
+_latest_silver: dict | None = None
+# Newest silver reading recorded (spooled) by this process, possibly not uploaded yet
+_recorded_silver: dict | None = None
+_latest_lock = threading.Lock()
+
+# Serializes this process's manifest updates; other processes (backfill,
+# compaction scripts) are handled by conditional writes
+_manifest_lock = threading.Lock()
+
+# Conditional read-modify-writes retried this many times before giving up
+CONDITIONAL_WRITE_ATTEMPTS = 10
+
+def storage_location() -> str:
+    """Where objects are stored (s3://bucket or a local directory), for log messages."""
+    return _store.location
+
+
+def _put_reading(key: str, d: dict) -> dict:
+    """
+    Upload a reading and keep a copy in the read cache.
+    
+    Returns:
+        The object's manifest entry: {"key", "ts", "size", "etag"}
+    """
+    body = json.dumps(d).encode("utf-8")
+    etag = _store.put(key, body)
+    if etag is not None:
+        _reading_cache.put(_cache_key(key, etag), dict(d), len(body))
+    return {"key": key, "ts": d["ts"], "size": len(body), "etag": etag}
+
+
+def _cache_key(key: str, etag: str) -> str:
+    """Reading-cache key for one version of an object."""
+    return f"{key}@{etag}"
+
+
+def reading_key(prefix: str, ts: str) -> str:
+    """Object key of a reading, e.g. samples/2025-10-06/2025-10-06T20-15-03Z.json"""
+    return f"{prefix}/{ts[:10]}/{ts.replace(':', '-')}.json"
+
+
+# "2025-10-06T20-15-03.123456Z.json" or "...T20-15-03-07-00.json" (UTC offset)
+_KEY_TS_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2})-(\d{2})-(\d{2})(\.\d+)?(Z|[+-]\d{2}-\d{2})?\.json$")
+
+
+def _ts_from_key(key: str) -> datetime | None:
+    """Recover a reading's timestamp from its key name, or None if the key doesn't encode one."""
+    match = _KEY_TS_RE.search(key)
+    if match is None:
+        return None
+    date, hh, mm, ss, fraction, offset = match.groups()
+    # Naive timestamps are treated as UTC; "-07-00" -> "-07:00"
+    if offset in (None, "Z"):
+        offset = "+00:00"
+    else:
+        offset = offset[0] + offset[1:].replace("-", ":")
+    try:
+        return datetime.fromisoformat(f"{date}T{hh}:{mm}:{ss}{fraction or ''}{offset}")
+    except ValueError:
+        return None
+
+
+def _ts_string_from_key(key: str) -> str | None:
+    """The reading ts a key was built from (the inverse of reading_key), or None."""
+    match = _KEY_TS_RE.search(key)
+    if match is None:
+        return None
+    date, hh, mm, ss, fraction, offset = match.groups()
+    if offset not in (None, "Z"):
+        offset = offset[0] + offset[1:].replace("-", ":")
+    return f"{date}T{hh}:{mm}:{ss}{fraction or ''}{offset or ''}"
+
+
+def _in_window(t: datetime | None, start: datetime | None, end: datetime | None) -> bool:
+    """Whether a key's timestamp may fall in [start, end]; unknown timestamps are kept."""
+    if t is None:
+        return True
+    return (start is None or t >= start) and (end is None or t <= end)
+
+
+def put_json_reading(d: dict, update_manifest: bool = True) -> dict:
+    """
+    Write raw reading to bronze layer.
+    
+    Args:
+        d: Bronze reading
+        update_manifest: Also add the object to its day's manifest. Callers that
+            write many readings pass False and call add_to_manifest once per batch.
+    
+    Returns:
+        The object's manifest entry
+    """
     # key like: samples/2025-10-06/2025-10-06T20-15-03Z.json
-    ts = d["ts"].replace(":", "-")
     date = d["ts"][:10]
-    key = f"{settings.s3_prefix}/{date}/{ts}.json"
-    _s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=json.dumps(d).encode("utf-8"))
+    key = reading_key(settings.s3_prefix, d["ts"])
+    entry = _put_reading(key, d)
+    if update_manifest:
+        add_to_manifest(settings.s3_prefix, date, [entry])
+    return entry
+
 
+def latest_pointer_key() -> str:
+    """Key of the small object that always holds the newest silver reading."""
+    return f"{settings.s3_silver_prefix}/latest.json"
 
-def put_silver_reading(d: dict):
-    """Write enriched reading to silver layer."""
+
+def put_silver_reading(d: dict, update_latest: bool = True, update_manifest: bool = True) -> dict:
+    """
+    Write enriched reading to silver layer.
+    
+    Args:
+        d: Silver reading
+        update_latest: Also advance the latest-reading pointer (in memory and
+            silver/latest.json) if this reading is the newest seen. Backfill
+            passes False since it rewrites history rather than appending to it.
+        update_manifest: Also add the object to its day's manifest (see put_json_reading)
+    
+    Returns:
+        The object's manifest entry
+    """
     # key like: silver/2025-10-06/2025-10-06T20-15-03Z.json
-    ts = d["ts"].replace(":", "-")
     date = d["ts"][:10]
-    key = f"{settings.s3_silver_prefix}/{date}/{ts}.json"
-    _s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=json.dumps(d).encode("utf-8"))
+    key = reading_key(settings.s3_silver_prefix, d["ts"])
+    entry = _put_reading(key, d)
+    
+    if update_manifest:
+        add_to_manifest(settings.s3_silver_prefix, date, [entry])
+    if update_latest:
+        update_latest_pointer(d)
+    return entry
+
+
+def latest_reading_ts() -> str | None:
+    """ts of the newest silver reading this process has written, without any S3 call."""
+    with _latest_lock:
+        return _latest_silver["ts"] if _latest_silver is not None else None
+
+
+def record_latest_reading(d: dict):
+    """Remember a reading that was just spooled as the newest one, before it is uploaded."""
+    global _recorded_silver
+    
+    with _latest_lock:
+        if _recorded_silver is None or _recorded_silver["ts"] <= d["ts"]:
+            _recorded_silver = dict(d)
+
+
+def _newest_in_memory() -> dict | None:
+    with _latest_lock:
+        candidates = [d for d in (_latest_silver, _recorded_silver) if d is not None]
+        return dict(max(candidates, key=lambda d: d["ts"])) if candidates else None
+
+
+def recorded_reading_ts() -> str | None:
+    """ts of the newest silver reading this process has recorded, uploaded or still spooled."""
+    newest = _newest_in_memory()
+    return newest["ts"] if newest is not None else None
+
+
+def update_latest_pointer(d: dict):
+    """Advance the latest-reading pointer (memory and silver/latest.json) if d is newer."""
+    global _latest_silver
+    
+    with _latest_lock:
+        if _latest_silver is not None and _latest_silver["ts"] > d["ts"]:
+            return
+        _latest_silver = dict(d)
+    put_json_object(latest_pointer_key(), d)
+
+
+def manifest_key(prefix: str, date: str) -> str:
+    """Key of the manifest listing one day's reading objects, e.g. silver/manifests/2025-10-06.json"""
+    return f"{prefix}/manifests/{date}.json"
+
+
+def get_manifest(prefix: str, date: str) -> list[dict] | None:
+    """
+    Read a day's manifest.
+    
+    Returns:
+        The day's object entries sorted by ts, or None if the day has no manifest
+        (days written before manifests existed).
+    """
+    manifest = get_json_object(manifest_key(prefix, date))
+    if manifest is None:
+        return None
+    return manifest.get("objects", [])
+
+
+def _merge_into_manifest(prefix: str, date: str, entries: list[dict]):
+    """
+    Merge entries into a day's manifest with a conditional write (see update_json_object),
+    so concurrent writers (API spool, backfill, compaction) never drop each other's entries.
+    """
+    def merge(manifest: dict | None) -> dict:
+        if manifest is None:
+            # First write of the day, or a day from before manifests: start from
+            # whatever objects are already there so none are hidden from readers
+            existing = _list_day_entries(prefix, date)
+        else:
+            existing = manifest.get("objects", [])
+        objects = {e["key"]: e for e in existing}
+        for entry in entries:
+            objects[entry["key"]] = entry
+        return {"date": date, "objects": sorted(objects.values(), key=lambda e: e["ts"])}
+    
+    with _manifest_lock:
+        update_json_object(manifest_key(prefix, date), merge)
+
+
+def add_to_manifest(prefix: str, date: str, entries: list[dict]):
+    """
+    Merge newly written objects into a day's manifest.
+    
+    Entries replace existing ones with the same key. The manifest is only
+    updated after its objects exist, so readers never see a key they can't GET.
+    """
+    if entries:
+        _merge_into_manifest(prefix, date, entries)
+
+
+def rebuild_manifest(prefix: str, date: str) -> int:
+    """
+    Merge a full listing of a day's objects into its manifest.
+    
+    Used to create manifests for days written before they existed, or to repair
+    one after a write was missed. Entries added concurrently by other writers
+    are kept.
+    
+    Returns:
+        Number of objects listed.
+    """
+    entries = _list_day_entries(prefix, date)
+    if entries:
+        _merge_into_manifest(prefix, date, entries)
+    return len(entries)
+
+
+def get_manifest_or_none(prefix: str, date: str) -> list[dict] | None:
+    """get_manifest that treats read errors like a missing manifest (callers fall back to listing)."""
+    try:
+        return get_manifest(prefix, date)
+    except Exception as e:
+        print(f"Error reading manifest {manifest_key(prefix, date)}: {e}", flush=True)
+        return None
+
+
+def _day_objects(
+    prefix: str,
+    date: str,
+    start: datetime | None = None,
+    end: datetime | None = None
+) -> list[dict]:
+    """
+    {"key", "etag"} of a day's reading objects whose key-name timestamp is in [start, end].
+    
+    Uses one GET of the manifest, or a listing if there is none. Keys embed the
+    UTC timestamp, so they sort by time and the listing starts after the cutoff
+    rather than at the beginning of the day.
+    """
+    manifest = get_manifest_or_none(prefix, date)
+    if manifest is not None:
+        objects = [{"key": e["key"], "etag": e.get("etag")} for e in manifest]
+    else:
+        start_after = None
+        if start is not None:
+            start_utc = start.astimezone(timezone.utc)
+            if start_utc.strftime("%Y-%m-%d") == date:
+                # Every key of that second or later sorts after this one
+                start_after = f"{prefix}/{date}/{start_utc.strftime('%Y-%m-%dT%H-%M-%S')}"
+        objects = [
+            {"key": o["key"], "etag": o["etag"]}
+            for o in _list_objects(f"{prefix}/{date}/", start_after=start_after)
+            if o["key"].endswith(".json")
+        ]
+    
+    if start is None and end is None:
+        return objects
+    return [o for o in objects if _in_window(_ts_from_key(o["key"]), start, end)]
+
 
 def get_latest_reading_from_s3() -> dict | None:
     """
     Retrieve the most recent weather reading from S3 silver layer.
-    Checks today and yesterday's folders.
+    
+    Served from memory when this process recorded the reading (including one
+    still waiting in the spool), otherwise from the silver/latest.json pointer
+    (one GET). Falls back to scanning today's and yesterday's folders if the
+    pointer does not exist yet.
     
     Returns:
         The most recent reading dictionary, or None if no readings found.
     """
+    newest = _newest_in_memory()
+    if newest is not None:
+        return newest
+    
+    try:
+        latest = get_json_object(latest_pointer_key())
+        if latest is not None:
+            return latest
+    except Exception as e:
+        print(f"Error reading latest pointer: {e}", flush=True)
+    
+    return _scan_latest_reading()
+
+
+def _scan_latest_reading() -> dict | None:
+    """Find the newest silver reading from today's and yesterday's manifests (or folder listings)."""
     now = datetime.now(timezone.utc)
     yesterday = now - timedelta(days=1)
     
@@ -52,24 +344,25 @@ def get_latest_reading_from_s3() -> dict | None:
         prefix = f"{settings.s3_silver_prefix}/{date}/"
         
         try:
-            # List all objects with this date prefix
-            response = _s3.list_objects_v2(
-                Bucket=settings.s3_bucket,
-                Prefix=prefix
-            )
-            
-            if 'Contents' not in response:
-                continue
-            
-            # Sort by LastModified to get most recent first
-            objects = sorted(response['Contents'], key=lambda x: x['LastModified'], reverse=True)
+            manifest = get_manifest_or_none(settings.s3_silver_prefix, date)
+            if manifest is not None:
+                # Manifest entries are sorted by ts, so the newest is last
+                objects = manifest[-1:]
+            else:
+                # List all objects with this date prefix
+                objects = _store.list(prefix)
+                
+                if not objects:
+                    continue
+                
+                # Sort by LastModified to get most recent first, and check the
+                # top 10 to be safe
+                objects = sorted(objects, key=lambda x: x['last_modified'], reverse=True)[:10]
             
-            # Check the most recent objects from this date
-            for obj in objects[:10]:  # Check top 10 to be safe
+            for obj in objects:
+                key = obj['key']
                 try:
-                    key = obj['Key']
-                    obj_response = _s3.get_object(Bucket=settings.s3_bucket, Key=key)
-                    data = json.loads(obj_response['Body'].read().decode('utf-8'))
+                    data = _get_reading(key, obj.get('etag'))
                     
                     reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
                     
@@ -87,129 +380,466 @@ def get_latest_reading_from_s3() -> dict | None:
     
     return latest_reading
 
-def get_readings_from_bronze(hours: int = 24) -> list[dict]:
+def _dates_in_window(start: datetime, end: datetime) -> list[str]:
+    """Return the YYYY-MM-DD date strings covered by [start, end], oldest first."""
+    dates = []
+    current = start
+    while current <= end:
+        date_str = current.strftime("%Y-%m-%d")
+        if date_str not in dates:
+            dates.append(date_str)
+        current += timedelta(days=1)
+    
+    # Stepping by whole days can skip the end date when start has a later time of day
+    end_str = end.strftime("%Y-%m-%d")
+    if end_str not in dates:
+        dates.append(end_str)
+    return dates
+
+
+def _list_objects(prefix: str, start_after: str | None = None) -> list[dict]:
     """
-    Retrieve readings from bronze layer (raw data) for calculations.
-    Used internally for computing pressure trends and daily stats.
+    List every object under a prefix as {"key", "size", "etag"}, following pagination.
     
     Args:
-        hours: Number of hours to look back (default: 24)
+        prefix: Key prefix to list
+        start_after: Only list keys that sort after this one
+    """
+    return [
+        {"key": obj["key"], "size": obj["size"], "etag": obj["etag"]}
+        for obj in _store.list(prefix, start_after)
+    ]
+
+
+def get_json_object(key: str) -> dict | None:
+    """
+    Uncached GET of a JSON object that may be rewritten (pointers, rollups).
     
     Returns:
-        A list of reading dictionaries sorted by timestamp (oldest first).
+        The parsed object, or None if the key does not exist.
     """
-    now = datetime.now(timezone.utc)
-    cutoff_time = now - timedelta(hours=hours)
+    body = _store.get(key)
+    if body is None:
+        return None
+    return json.loads(body.decode('utf-8'))
+
+
+def put_json_object(key: str, d: dict):
+    """Write a JSON object that may be rewritten later (pointers, rollups)."""
+    _store.put(key, json.dumps(d).encode("utf-8"), content_type="application/json")
+
+
+def update_json_object(key: str, update) -> dict | None:
+    """
+    Read-modify-write a JSON object that other processes may also be updating.
     
-    dates_to_check = []
-    current = cutoff_time
-    while current <= now:
-        date_str = current.strftime("%Y-%m-%d")
-        if date_str not in dates_to_check:
-            dates_to_check.append(date_str)
-        current += timedelta(days=1)
+    `update` gets the current object (None if it does not exist) and returns the
+    object to write, or None to leave it as is. The write is conditional on the
+    object not having changed since it was read; if it did, `update` runs again
+    on the new version after a short jittered backoff.
     
-    readings = []
+    Returns:
+        The object written, or None if `update` made no change.
     
-    for date in dates_to_check:
-        prefix = f"{settings.s3_prefix}/{date}/"
+    Raises:
+        RuntimeError: If the write conflicted CONDITIONAL_WRITE_ATTEMPTS times in a row.
+    """
+    for attempt in range(CONDITIONAL_WRITE_ATTEMPTS):
+        if attempt:
+            # Jittered backoff so competing writers stop colliding
+            time.sleep(random.uniform(0, 0.05 * attempt))
+        result = _store.get_with_etag(key)
+        if result is None:
+            current, etag = None, None
+        else:
+            body, etag = result
+            current = json.loads(body.decode("utf-8"))
         
+        new = update(current)
+        if new is None:
+            return None
         try:
-            paginator = _s3.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=settings.s3_bucket, Prefix=prefix)
-            
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
-                    
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    
-                    try:
-                        response = _s3.get_object(Bucket=settings.s3_bucket, Key=key)
-                        data = json.loads(response['Body'].read().decode('utf-8'))
-                        
-                        reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
-                        
-                        if reading_time >= cutoff_time:
-                            readings.append(data)
-                            
-                    except Exception as e:
-                        continue
-                        
+            _store.put(
+                key,
+                json.dumps(new).encode("utf-8"),
+                content_type="application/json",
+                if_match=etag,
+                if_none_match=etag is None
+            )
+            return new
+        except PreconditionFailed:
+            continue
+    raise RuntimeError(f"Could not update {key}: {CONDITIONAL_WRITE_ATTEMPTS} conflicting writes in a row")
+
+
+def _get_reading(key: str, etag: str | None = None) -> dict:
+    """
+    Read-through cached GET for a reading object.
+    
+    The cache is only used when the caller knows the object's current ETag (from
+    a manifest or listing), so a reading rewritten by a backfill is fetched again
+    rather than served from an old copy. Returns a fresh copy so callers can
+    mutate it without touching the cache.
+    """
+    cached = _reading_cache.get(_cache_key(key, etag)) if etag is not None else None
+    if cached is None:
+        result = _store.get_with_etag(key)
+        if result is None:
+            raise KeyError(f"No object at {key}")
+        body, current_etag = result
+        cached = json.loads(body.decode('utf-8'))
+        if current_etag is not None:
+            _reading_cache.put(_cache_key(key, current_etag), cached, len(body))
+    return dict(cached)
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """Shared bounded pool used for fan-out GETs."""
+    global _fetch_executor
+    if _fetch_executor is None:
+        _fetch_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.s3_fetch_concurrency),
+            thread_name_prefix="s3-fetch"
+        )
+    return _fetch_executor
+
+
+def fetch_json_objects(keys: list[str], etags: list[str | None] | None = None) -> tuple[list[dict], dict[str, str]]:
+    """
+    Fetch and parse many JSON objects concurrently.
+    
+    At most `settings.s3_fetch_concurrency` GETs are in flight at once. A failure
+    on one key is recorded and the remaining keys are still fetched. Objects
+    whose ETag is given and already in the reading cache are served from memory
+    without a request.
+    
+    Args:
+        keys: Object keys to fetch
+        etags: Current ETag of each key (from a manifest or listing), if known
+    
+    Returns:
+        A tuple of (objects, errors). Objects keep the order of `keys` (failed keys
+        are left out) and errors maps each failed key to its error message.
+    """
+    def fetch(key: str, etag: str | None):
+        try:
+            return _get_reading(key, etag), None
         except Exception as e:
+            return None, str(e)
+    
+    if not keys:
+        return [], {}
+    if etags is None:
+        etags = [None] * len(keys)
+    
+    objects = []
+    errors = {}
+    for key, (data, error) in zip(keys, get_fetch_executor().map(fetch, keys, etags)):
+        if error is not None:
+            errors[key] = error
+        else:
+            objects.append(data)
+    return objects, errors
+
+
+def compacted_key(prefix: str, date: str) -> str:
+    """Key of the compacted object for one UTC day, e.g. silver/compacted/2025-10-06.ndjson.gz"""
+    return f"{prefix}/compacted/{date}.ndjson.gz"
+
+
+def get_compacted_day(prefix: str, date: str) -> list[dict] | None:
+    """
+    Read the compacted file for one day.
+    
+    Compacted days are rewritten by recompaction (possibly in another process),
+    so a cached copy is revalidated with a conditional GET, which transfers no
+    body while the object is unchanged.
+    
+    Returns:
+        The day's readings sorted oldest first, or None if the day has not been compacted.
+    """
+    key = compacted_key(prefix, date)
+    cached = _reading_cache.get(key)
+    result = _store.get_with_etag(key, if_none_match=cached[0] if cached else None)
+    if result is None:
+        _reading_cache.invalidate(key)
+        return None
+    body, etag = result
+    if body is not None:
+        raw = gzip.decompress(body)
+        cached = (etag, [json.loads(line) for line in raw.decode('utf-8').splitlines() if line])
+        _reading_cache.put(key, cached, len(raw))
+    return [dict(r) for r in cached[1]]
+
+
+def _list_day_entries(prefix: str, date: str) -> list[dict]:
+    """
+    Manifest entries for every reading object of one day, from a listing alone.
+    
+    The ts comes from the key name, so no object is read; keys that don't
+    encode a timestamp (not written by reading_key) are skipped with a warning.
+    
+    Returns:
+        Entries sorted by ts.
+    """
+    entries = []
+    for obj in _list_objects(f"{prefix}/{date}/"):
+        if not obj["key"].endswith(".json"):
             continue
+        ts = _ts_string_from_key(obj["key"])
+        if ts is None:
+            print(f"Skipping {obj['key']} in manifest: no timestamp in its name", flush=True)
+            continue
+        entries.append({"key": obj["key"], "ts": ts, "size": obj["size"], "etag": obj["etag"]})
+    entries.sort(key=lambda e: e["ts"])
+    return entries
+
+
+def _scan_day(prefix: str, date: str) -> tuple[list[dict], list[dict]]:
+    """
+    List and fetch every raw reading object of one day.
     
+    Returns:
+        (manifest entries, readings), both sorted by ts.
+    
+    Raises:
+        RuntimeError: If any object could not be read.
+    """
+    objects = [o for o in _list_objects(f"{prefix}/{date}/") if o["key"].endswith(".json")]
+    readings, errors = fetch_json_objects([o["key"] for o in objects], [o["etag"] for o in objects])
+    if errors:
+        raise RuntimeError(f"Could not read {len(errors)} object(s) under {prefix}/{date}/")
+    
+    entries = [{**o, "ts": r["ts"]} for o, r in zip(objects, readings)]
+    entries.sort(key=lambda e: e["ts"])
     readings.sort(key=lambda x: x['ts'])
-    return readings
+    return entries, readings
 
 
-def get_readings_last_n_hours(hours: int = 24) -> list[dict]:
+def compact_day(prefix: str, date: str) -> int:
     """
-    Retrieve all weather readings from the last N hours from S3 silver layer.
+    Combine every raw reading of one UTC day into a single gzipped NDJSON object.
+    
+    The raw per-reading objects are left in place. Re-running replaces the compacted
+    object, which is how a day is refreshed after a backfill rewrites it. The
+    same listing is merged into the day's manifest, so it is complete once a
+    day is finished.
     
     Args:
-        hours: Number of hours to look back (default: 24)
+        prefix: Layer prefix (settings.s3_prefix or settings.s3_silver_prefix)
+        date: Day to compact in YYYY-MM-DD format
     
     Returns:
-        A list of reading dictionaries sorted by timestamp (oldest first).
+        Number of readings written (0 if the day has no readings and nothing was written).
+    """
+    # Refuses (raises) rather than write a compacted file that silently drops readings
+    entries, readings = _scan_day(prefix, date)
+    if not readings:
+        return 0
+    
+    raw = "".join(json.dumps(r) + "\n" for r in readings).encode("utf-8")
+    key = compacted_key(prefix, date)
+    _store.put(key, gzip.compress(raw), content_type="application/x-ndjson")
+    _reading_cache.invalidate(key)
+    _merge_into_manifest(prefix, date, entries)
+    return len(readings)
+
+
+def compact_finished_days(days: int = 2, force: bool = False) -> dict[str, int]:
+    """
+    Compact the last N finished UTC days of the bronze and silver layers.
+    
+    Today is never compacted because it is still being written.
+    
+    Args:
+        days: How many days before today to consider
+        force: Recompact days that already have a compacted object
+    
+    Returns:
+        Mapping of compacted key -> number of readings written.
+    """
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    written = {}
+    for offset in range(days, 0, -1):
+        date = (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+        for prefix in (settings.s3_prefix, settings.s3_silver_prefix):
+            if not force and get_compacted_day(prefix, date) is not None:
+                continue
+            count = compact_day(prefix, date)
+            if count:
+                written[compacted_key(prefix, date)] = count
+    return written
+
+
+def get_day_readings(
+    prefix: str,
+    date: str,
+    start: datetime | None = None,
+    end: datetime | None = None
+) -> tuple[list[dict], dict[str, str]]:
+    """
+    Fetch all readings of one UTC day, oldest first.
+    
+    Finished days are served from their compacted object when one exists; today
+    (and any day not yet compacted) falls back to the raw per-reading objects,
+    found through the day's manifest rather than a listing when it has one.
+    
+    The start/end window only prunes which raw objects are downloaded. A
+    compacted day is returned whole, so callers still filter readings by ts.
+    
+    Args:
+        prefix: Layer prefix
+        date: Day in YYYY-MM-DD format
+        start: Skip raw objects whose key names a time before this
+        end: Skip raw objects whose key names a time after this
+    
+    Returns:
+        A tuple of (readings, per-key errors).
+    """
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    if date < today:
+        try:
+            compacted = get_compacted_day(prefix, date)
+        except Exception as e:
+            print(f"Error reading compacted day {prefix}/{date}: {e}", flush=True)
+            compacted = None
+        if compacted is not None:
+            return compacted, {}
+    
+    date_prefix = f"{prefix}/{date}/"
+    try:
+        objects = _day_objects(prefix, date, start, end)
+    except Exception as e:
+        return [], {date_prefix: str(e)}
+    readings, errors = fetch_json_objects([o["key"] for o in objects], [o["etag"] for o in objects])
+    readings.sort(key=lambda x: x['ts'])
+    return readings, errors
+
+
+def _scan_readings(prefix: str, hours: float) -> tuple[list[dict], dict[str, str]]:
+    """
+    Fetch every reading under `prefix` from the last N hours.
+    
+    Returns:
+        A tuple of (readings sorted oldest first, per-key/per-date errors).
     """
     now = datetime.now(timezone.utc)
     cutoff_time = now - timedelta(hours=hours)
     
-    # Generate all dates between cutoff and now
-    # This ensures we check all days that might contain relevant readings
-    dates_to_check = []
-    current = cutoff_time
-    while current <= now:
-        date_str = current.strftime("%Y-%m-%d")
-        if date_str not in dates_to_check:
-            dates_to_check.append(date_str)
-        current += timedelta(days=1)
+    objects = []
+    errors = {}
+    for date in _dates_in_window(cutoff_time, now):
+        day_readings, day_errors = get_day_readings(prefix, date, start=cutoff_time)
+        objects.extend(day_readings)
+        errors.update(day_errors)
     
     readings = []
-    
-    print(f"Fetching {hours}h history from silver layer. Checking dates: {dates_to_check}", flush=True)
-    print(f"Using bucket: {settings.s3_bucket}, prefix: {settings.s3_silver_prefix}", flush=True)
-    
-    for date in dates_to_check:
-        prefix = f"{settings.s3_silver_prefix}/{date}/"
-        
+    for data in objects:
         try:
-            # List all objects with this date prefix
-            paginator = _s3.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=settings.s3_bucket, Prefix=prefix)
-            
-            for page in pages:
-                if 'Contents' not in page:
-                    print(f"No contents found for prefix: {prefix}", flush=True)
-                    continue
-                    
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    
-                    try:
-                        # Fetch the object
-                        response = _s3.get_object(Bucket=settings.s3_bucket, Key=key)
-                        data = json.loads(response['Body'].read().decode('utf-8'))
-                        
-                        # Parse timestamp and filter by 24h window
-                        reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
-                        
-                        if reading_time >= cutoff_time:
-                            readings.append(data)
-                            
-                    except Exception as e:
-                        print(f"Error reading object {key}: {e}")
-                        continue
-                        
+            reading_time = datetime.fromisoformat(data['ts'].replace('Z', '+00:00'))
         except Exception as e:
-            print(f"Error listing objects for date {date}: {e}")
+            errors[data.get('ts', '<missing ts>')] = f"Bad timestamp: {e}"
             continue
+        if reading_time >= cutoff_time:
+            readings.append(data)
     
-    # Sort by timestamp (oldest first)
     readings.sort(key=lambda x: x['ts'])
+    return readings, errors
+
+
+def get_readings_from_bronze(hours: int = 24) -> list[dict]:
+    """
+    Retrieve readings from bronze layer (raw data) for calculations.
+    Used internally for computing pressure trends and daily stats.
+    
+    Args:
+        hours: Number of hours to look back (default: 24)
+    
+    Returns:
+        A list of reading dictionaries sorted by timestamp (oldest first).
+    """
+    readings, errors = _scan_readings(settings.s3_prefix, hours)
+    if errors:
+        print(f"Skipped {len(errors)} unreadable bronze object(s) in last {hours}h", flush=True)
+    return readings
+
+
+def get_readings_last_n_hours(hours: int = 24) -> list[dict]:
+    """
+    Retrieve all weather readings from the last N hours from S3 silver layer.
+    
+    Args:
+        hours: Number of hours to look back (default: 24)
+    
+    Returns:
+        A list of reading dictionaries sorted by timestamp (oldest first).
+    """
+    if hot_tier.covers(hours):
+        readings = hot_tier.readings_since(datetime.now(timezone.utc) - timedelta(hours=hours))
+        print(f"Found {len(readings)} readings in last {hours}h (hot tier)", flush=True)
+        return readings
+    
+    print(f"Fetching {hours}h history from silver layer", flush=True)
+    print(f"Using storage: {_store.location}, prefix: {settings.s3_silver_prefix}", flush=True)
+    
+    readings, errors = _scan_readings(settings.s3_silver_prefix, hours)
+    for key, error in errors.items():
+        print(f"Error reading {key}: {error}", flush=True)
     
     print(f"Found {len(readings)} readings in last {hours}h", flush=True)
     
     return readings
+
+
+# Extra look-back of every incremental sync, for readings other processes
+# (a standalone collector) upload a while after their timestamp
+HOT_SYNC_OVERLAP_HOURS = 1
+
+
+def sync_hot_tier(pending_readings=None) -> int:
+    """
+    Copy silver readings the hot tier is missing from storage.
+    
+    Without a watermark (first start, or after `hot_tier.invalidate()`) the
+    tier is cleared and the whole retention window is loaded; otherwise only
+    what was written since the watermark is fetched. The watermark only moves
+    when every object was read, so after an error the tier keeps its previous
+    state (or stays off) and the next sync covers the same gap again.
+    
+    Readings still waiting to be uploaded are put back after a clear, and the
+    watermark never passes the oldest of them: storage is only complete up to
+    there, so the next sync rescans from it however long the spool is backed up.
+    
+    Args:
+        pending_readings: Returns the readings recorded but not uploaded yet
+            (the spool's), oldest first
+    
+    Returns:
+        Number of readings loaded.
+    """
+    if not hot_tier.enabled:
+        return 0
+    
+    started = datetime.now(timezone.utc)
+    hours = hot_tier.retention_days * 24
+    synced_through = hot_tier.synced_through()
+    if synced_through is None:
+        hot_tier.clear()
+    else:
+        hours = min(hours, (started - synced_through).total_seconds() / 3600 + HOT_SYNC_OVERLAP_HOURS)
+    
+    # Read after the clear, so a reading is either in here or added to the tier later
+    pending = pending_readings() if pending_readings is not None else []
+    readings, errors = _scan_readings(settings.s3_silver_prefix, hours)
+    hot_tier.add_many(readings + pending)
+    if errors:
+        print(f"Hot tier sync incomplete: {len(errors)} unreadable silver object(s)", flush=True)
+        return len(readings)
+    
+    through = started
+    if pending:
+        through = min(through, datetime.fromisoformat(min(r["ts"] for r in pending).replace("Z", "+00:00")))
+    hot_tier.mark_synced(through)
+    if synced_through is None:
+        print(f"Hot tier ready: loaded {len(readings)} readings from the last {hours:.1f}h", flush=True)
+    return len(readings)
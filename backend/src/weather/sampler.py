@@ -0,0 +1,134 @@
+"""
+High-frequency sensor oversampling.
+
+A dedicated thread reads the sensor at SENSOR_SAMPLE_HZ and keeps every sample
+of the current interval in memory. Once per upload interval the samples are
+reduced to median/mean/min/max per field and the window starts over, so one
+bronze record summarizes hundreds of reads without any extra S3 PUTs.
+
+The most recent sample is also kept as a snapshot, so callers like /current
+can use it instead of reading the sensor themselves.
+"""
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+
+class SensorSampler:
+    """
+    Background thread that samples `read_fn` at a fixed rate.
+
+    `read_fn` returns a dict of numeric fields (None for a field that could not
+    be read). Failed reads are counted and skipped; the thread keeps going.
+    """
+
+    def __init__(self, read_fn: Callable[[], dict], rate_hz: float):
+        self.read_fn = read_fn
+        self.rate_hz = rate_hz
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[float]] = {}
+        self._count = 0
+        self._errors = 0
+        self._window_start: Optional[datetime] = None
+        self._latest: Optional[tuple[dict, datetime]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _add(self, sample: dict):
+        taken_at = datetime.now(timezone.utc)
+        with self._lock:
+            self._latest = (sample, taken_at)
+            if self._window_start is None:
+                self._window_start = taken_at
+            for field, value in sample.items():
+                if value is not None:
+                    self._samples.setdefault(field, []).append(value)
+            self._count += 1
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self._add(self.read_fn())
+            except Exception as e:
+                self._errors += 1
+                # One line per 100 failures is enough to notice a broken sensor
+                if self._errors % 100 == 1:
+                    print(f"Sensor sample failed ({self._errors} so far): {e}", flush=True)
+
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Reads are slower than the requested rate; don't try to catch up
+                next_tick = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+    def start(self):
+        """Start sampling (no-op if already running or the rate is 0)."""
+        if self.running or self.rate_hz <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="weather-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def latest(self) -> Optional[tuple[dict, datetime]]:
+        """The most recent sample and when it was taken, or None before the first read."""
+        with self._lock:
+            return self._latest
+
+    def refresh(self) -> tuple[dict, datetime]:
+        """
+        Read the sensor now and make that the latest snapshot.
+
+        The sample is not added to the current interval, so on-demand reads don't
+        skew the aggregated record towards request times.
+        """
+        sample = self.read_fn()
+        taken_at = datetime.now(timezone.utc)
+        with self._lock:
+            if self._latest is None or taken_at > self._latest[1]:
+                self._latest = (sample, taken_at)
+        return sample, taken_at
+
+    def take_interval(self) -> Optional[dict]:
+        """
+        Summarize the samples taken since the previous call and start a new window.
+
+        Returns:
+            {"count", "start", "end", "fields": {field: {"median", "mean", "min", "max"}}}
+            or None if no sample was taken.
+        """
+        with self._lock:
+            samples, count, start = self._samples, self._count, self._window_start
+            self._samples, self._count, self._window_start = {}, 0, None
+
+        if count == 0:
+            return None
+        return {
+            "count": count,
+            "start": start,
+            "end": datetime.now(timezone.utc),
+            "fields": {
+                field: {
+                    "median": statistics.median(values),
+                    "mean": statistics.fmean(values),
+                    "min": min(values),
+                    "max": max(values),
+                }
+                for field, values in samples.items()
+            },
+        }
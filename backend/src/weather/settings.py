@@ -8,19 +8,57 @@ env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 class Settings(BaseModel):
+    # Local state (spool, caches) lives outside the checkout, which deploys wipe
+    # (rsync --delete, git clean on the runner)
+    state_dir: str = os.getenv(
+        "WEATHER_STATE_DIR",
+        str(Path(os.getenv("XDG_DATA_HOME", str(Path.home() / ".local" / "share"))) / "weather")
+    )
+    
     # AWS Credentials
     aws_access_key_id: str = os.getenv("AWS_ACCESS_KEY_ID", "")
     aws_secret_access_key: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
     aws_region: str = os.getenv("AWS_REGION", "us-west-2")
     
+    # Where every layer is stored: "s3" (the bucket below) or "local" (LOCAL_STORAGE_PATH, same key layout)
+    storage_backend: str = os.getenv("STORAGE_BACKEND", "s3").lower()
+    local_storage_path: str = os.getenv("LOCAL_STORAGE_PATH", str(Path(state_dir) / "data"))
+    
     # S3 Configuration
     s3_bucket: str = os.getenv("S3_BUCKET", "manoa-raspi-weather")
     s3_prefix: str = os.getenv("S3_PREFIX", "samples")  # Bronze layer (raw data)
     s3_silver_prefix: str = os.getenv("S3_SILVER_PREFIX", "silver")  # Silver layer (enriched data)
+    s3_gold_prefix: str = os.getenv("S3_GOLD_PREFIX", "gold")  # Gold layer (hourly/daily rollups)
+    
+    # Max number of concurrent GETs when scanning a window of readings
+    s3_fetch_concurrency: int = int(os.getenv("S3_FETCH_CONCURRENCY", "16"))
+    
+    # In-memory cache of already-downloaded readings (set either to 0 to disable)
+    s3_cache_max_entries: int = int(os.getenv("S3_CACHE_MAX_ENTRIES", "20000"))
+    s3_cache_max_bytes: int = int(os.getenv("S3_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
     
     # Application Configuration
     sample_interval_sec: int = int(os.getenv("SAMPLE_INTERVAL_SEC", "900")) # i picked every 15 minutes here, just because round
     
+    # Sensor reads per second within each interval; each uploaded reading aggregates them (0 = one read per interval)
+    sensor_sample_hz: float = float(os.getenv("SENSOR_SAMPLE_HZ", "1"))
+    
+    # Local SQLite copy of the last HOT_TIER_DAYS of silver readings that serves /history (0 = disabled)
+    hot_tier_path: str = os.getenv("HOT_TIER_PATH", str(Path(state_dir) / "hot.db"))
+    hot_tier_days: int = int(os.getenv("HOT_TIER_DAYS", "7"))
+    
+    # Seconds between /current snapshots pushed to /stream clients
+    stream_current_interval_sec: float = float(os.getenv("STREAM_CURRENT_INTERVAL_SEC", "5"))
+    
+    # Worker threads the API uses for blocking S3 calls
+    io_workers: int = int(os.getenv("IO_WORKERS", "4"))
+    
+    # Local write-ahead spool: readings are committed here before being uploaded
+    spool_path: str = os.getenv("SPOOL_PATH", str(Path(state_dir) / "spool.db"))
+    spool_batch_size: int = int(os.getenv("SPOOL_BATCH_SIZE", "50"))
+    spool_max_backoff_sec: int = int(os.getenv("SPOOL_MAX_BACKOFF_SEC", "300"))
+    spool_max_attempts: int = int(os.getenv("SPOOL_MAX_ATTEMPTS", "10"))
+    
     # Sensor Calibration
     # Static temperature offset in Celsius to subtract from pressure sensor reading
     # This compensates for ambient heat from the Pi board
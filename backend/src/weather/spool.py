@@ -0,0 +1,257 @@
+"""
+Local write-ahead spool for bronze and silver uploads.
+
+Every reading is committed to a small SQLite database before anything touches
+the network. A background thread drains the spool to S3 in batches, oldest
+first, and backs off while S3 is slow or unreachable, so sampling never waits
+on uploads and readings taken during an outage are uploaded once it ends.
+
+A reading that keeps failing while the readings after it upload fine (so the
+problem is that reading, not the network) is moved to a dead_letter table after
+SPOOL_MAX_ATTEMPTS tries instead of blocking the queue forever.
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from .gold import update_gold
+from .s3 import (
+    add_to_manifest,
+    put_json_reading,
+    put_silver_reading,
+    update_latest_pointer,
+    get_fetch_executor
+)
+from .settings import settings
+
+
+class ReadingSpool:
+    """
+    Durable FIFO of (bronze, silver) reading pairs waiting to be uploaded.
+
+    Rows are deleted only after both objects are in S3 and the gold rollups have
+    been given the silver reading, so a crash at any point leads to at most a
+    repeated (idempotent) PUT, never a lost reading.
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, max_backoff_sec: float = 300, max_attempts: int = 10):
+        self.path = path
+        self.batch_size = batch_size
+        self.max_backoff_sec = max_backoff_sec
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pending ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " ts TEXT NOT NULL,"
+                " bronze TEXT NOT NULL,"
+                " silver TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS dead_letter ("
+                " id INTEGER PRIMARY KEY,"
+                " ts TEXT NOT NULL,"
+                " bronze TEXT NOT NULL,"
+                " silver TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL,"
+                " error TEXT,"
+                " failed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def enqueue(self, bronze: dict, silver: dict):
+        """Durably record a reading pair and wake the flusher."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO pending (ts, bronze, silver) VALUES (?, ?, ?)",
+                (bronze["ts"], json.dumps(bronze), json.dumps(silver))
+            )
+            conn.commit()
+        self._wake.set()
+
+    def pending(self) -> int:
+        """Number of readings not yet uploaded."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+    def pending_readings(self) -> list[dict]:
+        """Silver readings not yet uploaded, oldest first."""
+        with self._lock:
+            rows = self._connect().execute("SELECT silver FROM pending ORDER BY id").fetchall()
+        return [json.loads(silver) for (silver,) in rows]
+
+    def dead_lettered(self) -> int:
+        """Number of readings given up on (kept in the dead_letter table for inspection)."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM dead_letter").fetchone()[0]
+
+    def _next_batch(self) -> list[tuple[int, dict, dict]]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT id, bronze, silver FROM pending ORDER BY id LIMIT ?",
+                (self.batch_size,)
+            ).fetchall()
+        return [(row_id, json.loads(bronze), json.loads(silver)) for row_id, bronze, silver in rows]
+
+    def flush(self) -> int:
+        """
+        Upload one batch of spooled readings.
+
+        The bronze and silver PUTs of a batch run concurrently, followed by one
+        manifest update per layer and day. Rows are then retired strictly in
+        order up to the first failure, so the gold rollups and the latest pointer
+        always see readings oldest first; anything after a failure stays spooled
+        and is retried as a whole.
+
+        A failed row's attempts are only counted when a later row of the same
+        batch uploaded, i.e. when storage is reachable and the row itself is the
+        problem; after max_attempts it is moved to the dead_letter table.
+
+        Returns:
+            Number of readings retired (including a dead-lettered one).
+
+        Raises:
+            Exception: The first upload error, after retiring the rows before it
+                (not raised when the failing row was dead-lettered).
+        """
+        batch = self._next_batch()
+        if not batch:
+            return 0
+
+        executor = get_fetch_executor()
+        futures = [
+            (
+                executor.submit(put_json_reading, bronze, update_manifest=False),
+                executor.submit(put_silver_reading, silver, update_latest=False, update_manifest=False)
+            )
+            for _, bronze, silver in batch
+        ]
+
+        # Uploaded prefix of the batch, grouped into manifest updates
+        uploaded = 0
+        manifest_entries: dict[tuple[str, str], list[dict]] = {}
+        error = None
+        for bronze_future, silver_future in futures:
+            try:
+                entries = [bronze_future.result(), silver_future.result()]
+            except Exception as e:
+                error = e
+                break
+            for prefix, entry in zip((settings.s3_prefix, settings.s3_silver_prefix), entries):
+                manifest_entries.setdefault((prefix, entry["ts"][:10]), []).append(entry)
+            uploaded += 1
+
+        # Let the remaining PUTs finish before retrying them in a later batch
+        for bronze_future, silver_future in futures[uploaded:]:
+            bronze_future.exception()
+            silver_future.exception()
+        row_at_fault = error is not None and any(
+            bronze_future.exception() is None and silver_future.exception() is None
+            for bronze_future, silver_future in futures[uploaded + 1:]
+        )
+
+        try:
+            for (prefix, date), entries in manifest_entries.items():
+                add_to_manifest(prefix, date, entries)
+        except Exception as e:
+            # Readers would not find these objects, so retry the whole batch
+            uploaded = 0
+            error = e
+            row_at_fault = False
+
+        done_ids = []
+        newest = None
+        for row_id, _, silver in batch[:uploaded]:
+            try:
+                update_gold(silver)
+            except Exception as e:
+                print(f"Error updating gold rollups: {e}", flush=True)
+            done_ids.append(row_id)
+            newest = silver
+
+        dead_ts = None
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM pending WHERE id = ?", [(i,) for i in done_ids])
+            if row_at_fault:
+                failed_id = batch[len(done_ids)][0]
+                conn.execute("UPDATE pending SET attempts = attempts + 1 WHERE id = ?", (failed_id,))
+                ts, attempts = conn.execute("SELECT ts, attempts FROM pending WHERE id = ?", (failed_id,)).fetchone()
+                if attempts >= self.max_attempts:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO dead_letter (id, ts, bronze, silver, attempts, error)"
+                        " SELECT id, ts, bronze, silver, attempts, ? FROM pending WHERE id = ?",
+                        (str(error), failed_id)
+                    )
+                    conn.execute("DELETE FROM pending WHERE id = ?", (failed_id,))
+                    dead_ts = ts
+            conn.commit()
+
+        if newest is not None:
+            try:
+                update_latest_pointer(newest)
+            except Exception as e:
+                print(f"Error updating latest pointer: {e}", flush=True)
+
+        if dead_ts is not None:
+            print(f"Giving up on reading {dead_ts} after {self.max_attempts} failed uploads "
+                  f"(moved to dead_letter in {self.path}): {error}", flush=True)
+            return len(done_ids) + 1
+        if error is not None:
+            raise error
+        return len(done_ids)
+
+    def _run(self):
+        backoff = 0.0
+        while not self._stop.is_set():
+            self._wake.wait(timeout=backoff or None)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                while self.flush():
+                    if self._stop.is_set():
+                        break
+                backoff = 0.0
+            except Exception as e:
+                backoff = min(max(backoff * 2, 5.0), self.max_backoff_sec)
+                print(f"Spool upload failed ({self.pending()} pending), retrying in {backoff:.0f}s: {e}", flush=True)
+
+    def start(self):
+        """Start the background flusher; it immediately drains anything left from a previous run."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="weather-spool", daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout: float = 10):
+        """Stop the flusher, waiting up to `timeout` seconds for the current batch."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+spool = ReadingSpool(
+    settings.spool_path,
+    batch_size=settings.spool_batch_size,
+    max_backoff_sec=settings.spool_max_backoff_sec,
+    max_attempts=settings.spool_max_attempts
+)
@@ -0,0 +1,279 @@
+"""
+Object storage backends.
+
+Everything in s3.py (readings, manifests, compacted days, gold rollups, the
+latest pointer) is stored as keyed objects through an ObjectStore, so the same
+key layout works on S3 or on a local directory tree:
+
+    STORAGE_BACKEND=s3     - the S3 bucket (default)
+    STORAGE_BACKEND=local  - files under LOCAL_STORAGE_PATH, one per key
+
+The local backend lets the Pi serve history straight from disk and lets the
+code run and be benchmarked without AWS.
+
+Objects that several processes read-modify-write (manifests, gold rollups) use
+conditional writes: put(..., if_match=etag) raises PreconditionFailed if the
+object changed since it was read, and the caller re-reads and merges again.
+"""
+import fcntl
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from .settings import settings
+
+
+class PreconditionFailed(Exception):
+    """A conditional write lost a race: the object changed (or appeared) since it was read."""
+
+
+class ObjectStore(ABC):
+    """Minimal key/value object store interface."""
+
+    # Human-readable location for log messages, e.g. s3://bucket
+    location = ""
+
+    @abstractmethod
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        content_type: str | None = None,
+        if_match: str | None = None,
+        if_none_match: bool = False
+    ) -> str | None:
+        """
+        Write an object, replacing any existing one.
+
+        Args:
+            key: Object key
+            body: Object contents
+            content_type: Optional MIME type
+            if_match: Only write if the current object has this ETag
+            if_none_match: Only write if the object does not exist yet
+
+        Returns:
+            The object's ETag (quoted, as S3 returns it), or None if unknown.
+
+        Raises:
+            PreconditionFailed: If a condition did not hold; nothing was written.
+        """
+
+    @abstractmethod
+    def get_with_etag(self, key: str, if_none_match: str | None = None) -> tuple[bytes | None, str | None] | None:
+        """
+        Read an object's body together with its ETag.
+
+        Args:
+            key: Object key
+            if_none_match: ETag of a copy the caller already has
+
+        Returns:
+            None if the key does not exist, (None, etag) if the object still has
+            the `if_none_match` ETag, otherwise (body, etag).
+        """
+
+    def get(self, key: str) -> bytes | None:
+        """Read an object's body, or None if the key does not exist."""
+        result = self.get_with_etag(key)
+        return None if result is None else result[0]
+
+    @abstractmethod
+    def list(self, prefix: str, start_after: str | None = None) -> list[dict]:
+        """
+        List objects under a prefix in key order.
+
+        Args:
+            prefix: Key prefix to list
+            start_after: Only list keys that sort after this one
+
+        Returns:
+            [{"key", "size", "etag", "last_modified"}] for each object
+        """
+
+
+class S3ObjectStore(ObjectStore):
+    """Objects in an S3 bucket."""
+
+    def __init__(self, bucket: str, client=None):
+        self.bucket = bucket
+        self.location = f"s3://{bucket}"
+        # The connection pool is sized to match the fetch engine so concurrent GETs don't queue
+        self.client = client or boto3.client(
+            "s3",
+            aws_access_key_id=settings.aws_access_key_id,
+            aws_secret_access_key=settings.aws_secret_access_key,
+            region_name=settings.aws_region,
+            config=Config(max_pool_connections=max(10, settings.s3_fetch_concurrency))
+        )
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        content_type: str | None = None,
+        if_match: str | None = None,
+        if_none_match: bool = False
+    ) -> str | None:
+        kwargs = {"Bucket": self.bucket, "Key": key, "Body": body}
+        if content_type:
+            kwargs["ContentType"] = content_type
+        if if_match is not None:
+            kwargs["IfMatch"] = if_match
+        if if_none_match:
+            kwargs["IfNoneMatch"] = "*"
+        try:
+            return self.client.put_object(**kwargs).get("ETag")
+        except ClientError as e:
+            # 409 ConditionalRequestConflict: a concurrent conditional write is in progress
+            if e.response.get('Error', {}).get('Code') in ('PreconditionFailed', 'ConditionalRequestConflict', '412', '409'):
+                raise PreconditionFailed(key) from e
+            raise
+
+    def get_with_etag(self, key: str, if_none_match: str | None = None) -> tuple[bytes | None, str | None] | None:
+        kwargs = {"Bucket": self.bucket, "Key": key}
+        if if_none_match is not None:
+            kwargs["IfNoneMatch"] = if_none_match
+        try:
+            response = self.client.get_object(**kwargs)
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code in ('NoSuchKey', '404'):
+                return None
+            if code in ('304', 'NotModified'):
+                return None, if_none_match
+            raise
+        return response['Body'].read(), response.get('ETag')
+
+    def list(self, prefix: str, start_after: str | None = None) -> list[dict]:
+        objects = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        kwargs = {"Bucket": self.bucket, "Prefix": prefix}
+        if start_after:
+            kwargs["StartAfter"] = start_after
+        for page in paginator.paginate(**kwargs):
+            for obj in page.get('Contents', []):
+                objects.append({
+                    "key": obj['Key'],
+                    "size": obj['Size'],
+                    "etag": obj.get('ETag'),
+                    "last_modified": obj['LastModified'],
+                })
+        return objects
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    Objects as files under a root directory, using the keys as relative paths.
+
+    Writes go to a temporary file that is renamed into place, so readers never
+    see a partial object. ETags come from the file's inode, mtime and size: every
+    write creates a new file, so they change whenever the object does, and
+    listings only need a stat() per file rather than reading it.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.location = str(self.root)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Key {key!r} escapes the storage root")
+        return path
+
+    @staticmethod
+    def _etag(stat: os.stat_result) -> str:
+        return f'"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    @contextmanager
+    def _conditional(self, path: Path, if_match: str | None, if_none_match: bool):
+        """Hold a lock on the store for the check-and-replace, so it is atomic across processes."""
+        if if_match is None and not if_none_match:
+            yield
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                current = self._etag(path.stat()) if path.exists() else None
+                if (if_none_match and current is not None) or (if_match is not None and current != if_match):
+                    raise PreconditionFailed(str(path))
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        content_type: str | None = None,
+        if_match: str | None = None,
+        if_none_match: bool = False
+    ) -> str | None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            etag = self._etag(os.stat(tmp))
+            with self._conditional(path, if_match, if_none_match):
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return etag
+
+    def get_with_etag(self, key: str, if_none_match: str | None = None) -> tuple[bytes | None, str | None] | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                etag = self._etag(os.fstat(f.fileno()))
+                if etag == if_none_match:
+                    return None, etag
+                return f.read(), etag
+        except FileNotFoundError:
+            return None
+
+    def list(self, prefix: str, start_after: str | None = None) -> list[dict]:
+        # Only walk the deepest directory the prefix names, like S3 only scans the prefix
+        base = self.root / prefix.rsplit("/", 1)[0] if "/" in prefix else self.root
+        if not base.is_dir():
+            return []
+
+        objects = []
+        for dirpath, dirnames, filenames in os.walk(base):
+            for name in filenames:
+                # Temporary files of in-progress writes and the lock file
+                if name.startswith("."):
+                    continue
+                path = Path(dirpath) / name
+                key = path.relative_to(self.root).as_posix()
+                if not key.startswith(prefix) or (start_after and key <= start_after):
+                    continue
+                stat = path.stat()
+                objects.append({
+                    "key": key,
+                    "size": stat.st_size,
+                    "etag": self._etag(stat),
+                    "last_modified": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                })
+        objects.sort(key=lambda o: o["key"])
+        return objects
+
+
+def create_store() -> ObjectStore:
+    """Build the object store selected by settings.storage_backend."""
+    if settings.storage_backend == "s3":
+        return S3ObjectStore(settings.s3_bucket)
+    if settings.storage_backend == "local":
+        return LocalObjectStore(settings.local_storage_path)
+    raise ValueError(f"Unknown STORAGE_BACKEND {settings.storage_backend!r}, expected 's3' or 'local'")
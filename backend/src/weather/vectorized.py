@@ -0,0 +1,113 @@
+"""
+NumPy batch versions of the per-reading calculations.
+
+Each function takes arrays (or anything np.asarray accepts) and returns arrays
+with exactly the values the scalar functions in calculations.py would produce
+element by element, so backfill and notebooks can enrich a whole day at once.
+"""
+import numpy as np
+
+from .calculations import calculate_dew_point
+
+# Comfort categories in code order; codes index into this tuple
+COMFORT_CATEGORIES = ("comfortable", "too_dry", "too_humid", "too_cold", "too_hot")
+COMFORT_COMFORTABLE, COMFORT_TOO_DRY, COMFORT_TOO_HUMID, COMFORT_TOO_COLD, COMFORT_TOO_HOT = range(5)
+
+
+def _near_half(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Mask of values whose scaled fraction is so close to .5 that np.round might differ from round()."""
+    scaled = np.abs(values) * 10 ** ndigits
+    return np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+
+
+def dew_point_batch(temp_c, humidity) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_dew_point.
+
+    Args:
+        temp_c: Temperatures in Celsius
+        humidity: Relative humidities as percentages (0-100)
+
+    Returns:
+        (dew_point_c, dew_point_f) arrays rounded to 2 decimals. Entries where the
+        scalar function would raise (humidity <= 0) are NaN.
+    """
+    temp_c = np.asarray(temp_c, dtype=float)
+    humidity = np.asarray(humidity, dtype=float)
+
+    # Magnus formula constants
+    a = 17.27
+    b = 237.7
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = ((a * temp_c) / (b + temp_c)) + np.log(humidity / 100.0)
+        dew_point_c = (b * alpha) / (a - alpha)
+    dew_point_f = dew_point_c * 1.8 + 32
+
+    invalid = ~np.isfinite(dew_point_c) | (humidity <= 0)
+    rounded_c = np.round(dew_point_c, 2)
+    rounded_f = np.round(dew_point_f, 2)
+    rounded_c[invalid] = np.nan
+    rounded_f[invalid] = np.nan
+
+    # np.round works on x * 100, so values sitting on a rounding boundary (and any
+    # last-bit difference between np.log and math.log) can land on the other side.
+    # Those few entries are recomputed with the scalar function.
+    suspect = ~invalid & (_near_half(dew_point_c, 2) | _near_half(dew_point_f, 2))
+    for i in np.flatnonzero(suspect):
+        exact = calculate_dew_point(float(temp_c.flat[i]), float(humidity.flat[i]))
+        rounded_c.flat[i] = exact["dew_point_c"]
+        rounded_f.flat[i] = exact["dew_point_f"]
+
+    return rounded_c, rounded_f
+
+
+def comfort_index_batch(temp_f, humidity, dew_point_f) -> np.ndarray:
+    """
+    Vectorized get_comfort_index returning category codes.
+
+    Returns:
+        int8 array of indexes into COMFORT_CATEGORIES
+    """
+    temp_f = np.asarray(temp_f, dtype=float)
+    humidity = np.asarray(humidity, dtype=float)
+    dew_point_f = np.asarray(dew_point_f, dtype=float)
+
+    # Same precedence as the scalar if/elif chain
+    return np.select(
+        [
+            temp_f < 60,
+            temp_f > 80,
+            humidity < 30,
+            dew_point_f > 65,
+            humidity > 70,
+        ],
+        [
+            COMFORT_TOO_COLD,
+            COMFORT_TOO_HOT,
+            COMFORT_TOO_DRY,
+            COMFORT_TOO_HUMID,
+            COMFORT_TOO_HUMID,
+        ],
+        default=COMFORT_COMFORTABLE
+    ).astype(np.int8)
+
+
+def comfort_labels(codes) -> list[str]:
+    """Turn comfort codes back into the string labels used in silver readings."""
+    return [COMFORT_CATEGORIES[c] for c in np.asarray(codes).tolist()]
+
+
+def enrich_batch(temp_c, temp_f, humidity) -> dict[str, np.ndarray]:
+    """
+    Compute every per-reading (non-windowed) silver metric for arrays of readings.
+
+    Returns:
+        Dict with dew_point_c, dew_point_f and comfort_code arrays
+    """
+    dew_point_c, dew_point_f = dew_point_batch(temp_c, humidity)
+    return {
+        "dew_point_c": dew_point_c,
+        "dew_point_f": dew_point_f,
+        "comfort_code": comfort_index_batch(temp_f, humidity, dew_point_f),
+    }
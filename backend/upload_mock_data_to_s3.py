@@ -2,8 +2,10 @@
 """
 Generate mock weather data and upload it directly to S3 with proper folder structure.
 This creates data for the last N hours with current timestamps.
+
+Readings go through the same storage path as the service (STORAGE_BACKEND),
+and are added to their days' manifests so readers can find them.
 """
-import json
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -12,8 +14,8 @@ import math
 # Add the src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-import boto3
 from weather.settings import settings
+from weather.s3 import put_json_reading, add_to_manifest, storage_location
 
 def generate_mock_readings(hours=24):
     """Generate realistic mock weather readings for the specified number of hours"""
@@ -59,40 +61,22 @@ def generate_mock_readings(hours=24):
 def upload_to_s3(readings):
     """Upload readings to S3 with proper folder structure"""
     print(f"Uploading {len(readings)} mock readings to S3")
-    print(f"Bucket: {settings.s3_bucket}")
+    print(f"Storage: {storage_location()}")
     print(f"Prefix: {settings.s3_prefix}")
-    print(f"Region: {settings.aws_region}")
     print("=" * 80)
     
-    # Create S3 client
-    s3 = boto3.client(
-        "s3",
-        aws_access_key_id=settings.aws_access_key_id,
-        aws_secret_access_key=settings.aws_secret_access_key,
-        region_name=settings.aws_region
-    )
-    
     uploaded = 0
     failed = 0
+    entries_by_date = {}
     
     for reading in readings:
         try:
-            # Create S3 key with date folder structure
-            # Format: samples/2025-10-10/2025-10-10T20-15-03.123456Z.json
-            ts = reading["ts"].replace(":", "-")
-            date = reading["ts"][:10]
-            key = f"{settings.s3_prefix}/{date}/{ts}.json"
-            
-            # Upload to S3
-            s3.put_object(
-                Bucket=settings.s3_bucket,
-                Key=key,
-                Body=json.dumps(reading).encode("utf-8"),
-                ContentType="application/json"
-            )
+            # Key format: samples/2025-10-10/2025-10-10T20-15-03.123456Z.json
+            entry = put_json_reading(reading, update_manifest=False)
+            entries_by_date.setdefault(reading["ts"][:10], []).append(entry)
             
             uploaded += 1
-            print(f"✅ {uploaded:2d}. {key}")
+            print(f"✅ {uploaded:2d}. {entry['key']}")
             print(f"     Temp: {reading['temp_c']}°C / {reading['temp_f']}°F, "
                   f"Humidity: {reading['humidity']}%, "
                   f"Pressure: {reading['pressure']} hPa")
@@ -101,6 +85,15 @@ def upload_to_s3(readings):
             failed += 1
             print(f"❌ Failed to upload {reading['ts']}: {e}")
     
+    # One manifest update per day; without it readers never see these objects
+    for date, entries in entries_by_date.items():
+        try:
+            add_to_manifest(settings.s3_prefix, date, entries)
+        except Exception as e:
+            failed += len(entries)
+            uploaded -= len(entries)
+            print(f"❌ Failed to update manifest for {date}: {e}")
+    
     print("=" * 80)
     print(f"✅ Successfully uploaded {uploaded} readings")
     if failed > 0:
@@ -1,22 +1,42 @@
 "use client"
 
-import { useEffect, useState } from "react";
-import { getLatest, getHistory, WeatherReading, HistoryResponse } from "@/lib/api";
+import { useEffect, useRef, useState } from "react";
+import { getLatest, getHistory, subscribeToStream, WeatherReading } from "@/lib/api";
 import { CurrentConditions } from "@/components/weather/current-conditions";
 import { DailySummary } from "@/components/weather/daily-summary";
 import { HistoryCharts } from "@/components/weather/history-charts";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Cloud } from "lucide-react";
 
+// Bucket size requested from the backend so charts stay at a few hundred points
+function historyResolution(hours: number): string | undefined {
+  if (hours <= 6) return undefined;
+  if (hours <= 24) return "5m";
+  if (hours <= 72) return "15m";
+  return "1h";
+}
+
+// Add a streamed reading to raw history, dropping readings that left the window
+function appendReading(readings: WeatherReading[], reading: WeatherReading, hours: number): WeatherReading[] {
+  if (readings.some((r) => r.ts === reading.ts)) return readings;
+  const cutoff = Date.now() - hours * 3600 * 1000;
+  return [...readings.filter((r) => Date.parse(r.ts) >= cutoff), reading];
+}
+
 export default function Dashboard() {
   const [currentData, setCurrentData] = useState<WeatherReading | null>(null);
   const [historyData, setHistoryData] = useState<WeatherReading[]>([]);
   const [isLoadingCurrent, setIsLoadingCurrent] = useState(true);
   const [isLoadingHistory, setIsLoadingHistory] = useState(true);
   const [hours, setHours] = useState(24);
+  // Read by the stream handler, which is set up once
+  const hoursRef = useRef(hours);
+  hoursRef.current = hours;
+  // Bumped for newly recorded readings when the charts need to refetch aggregated history
+  const [historyVersion, setHistoryVersion] = useState(0);
   const [error, setError] = useState<string | null>(null);
 
-  // Fetch current conditions
+  // Fetch current conditions once, then follow the live stream
   useEffect(() => {
     async function fetchCurrent() {
       try {
@@ -41,9 +61,23 @@ export default function Dashboard() {
     }
 
     fetchCurrent();
-    // Refresh every 60 seconds
-    const interval = setInterval(fetchCurrent, 60000);
-    return () => clearInterval(interval);
+    return subscribeToStream({
+      onReading: (reading) => {
+        setCurrentData(reading);
+        setError(null);
+        // Raw history takes the streamed reading as is; bucketed history is refetched
+        const windowHours = hoursRef.current;
+        if (historyResolution(windowHours) === undefined) {
+          setHistoryData((readings) => appendReading(readings, reading, windowHours));
+        } else {
+          setHistoryVersion((version) => version + 1);
+        }
+      },
+      onCurrent: (reading) => {
+        setCurrentData(reading);
+        setError(null);
+      },
+    });
   }, []);
 
   // Fetch historical data
@@ -51,7 +85,7 @@ export default function Dashboard() {
     async function fetchHistory() {
       try {
         setIsLoadingHistory(true);
-        const data = await getHistory(hours);
+        const data = await getHistory(hours, historyResolution(hours));
         setHistoryData(data.readings);
       } catch (err) {
         console.error("Error fetching history:", err);
@@ -61,7 +95,7 @@ export default function Dashboard() {
     }
 
     fetchHistory();
-  }, [hours]);
+  }, [hours, historyVersion]);
 
   return (
     <div className="min-h-screen bg-background">
@@ -62,6 +62,7 @@ export interface WeatherReading {
 
 export interface HistoryResponse {
   hours: number;
+  resolution?: string;
   count: number;
   readings: WeatherReading[];
 }
@@ -71,7 +72,8 @@ export interface HistoryResponse {
  */
 export async function getLatest(): Promise<WeatherReading> {
   const response = await fetch(`${API_URL}/latest`, {
-    cache: 'no-store',
+    // Revalidate with the backend's ETag on every poll (a 304 when nothing changed)
+    cache: 'no-cache',
   });
   
   if (!response.ok) {
@@ -93,13 +95,72 @@ export async function getLatest(): Promise<WeatherReading> {
   return data;
 }
 
+export interface StreamHandlers {
+  /** A new reading was recorded (the same data /latest returns) */
+  onReading?: (reading: WeatherReading) => void;
+  /** Live sensor snapshot (the same data /current returns) */
+  onCurrent?: (reading: WeatherReading) => void;
+}
+
+/**
+ * Subscribe to the backend's server-sent event stream.
+ * The browser reconnects automatically if the connection drops.
+ * @returns Function that closes the stream
+ */
+export function subscribeToStream(handlers: StreamHandlers): () => void {
+  const source = new EventSource(`${API_URL}/stream`);
+  
+  source.addEventListener('reading', (event) => {
+    handlers.onReading?.(JSON.parse((event as MessageEvent).data));
+  });
+  source.addEventListener('current', (event) => {
+    const data = JSON.parse((event as MessageEvent).data);
+    if (!('error' in data)) {
+      handlers.onCurrent?.(data);
+    }
+  });
+  source.onerror = () => {
+    console.warn('Live stream interrupted, reconnecting...');
+  };
+  
+  return () => source.close();
+}
+
+// Fields the history charts use; only these are requested from /history
+const HISTORY_FIELDS = ['temp_f', 'temp_from_humidity', 'temp_from_pressure', 'humidity', 'pressure'];
+
+/**
+ * Rebuild reading objects from a columnar /history response ({field: values[]})
+ */
+function columnsToReadings(columns: Record<string, unknown[]>): WeatherReading[] {
+  const names = Object.keys(columns);
+  const count = columns.ts ? columns.ts.length : 0;
+  const readings: WeatherReading[] = [];
+  for (let i = 0; i < count; i++) {
+    const reading: Record<string, unknown> = {};
+    for (const name of names) {
+      reading[name] = columns[name][i];
+    }
+    readings.push(reading as unknown as WeatherReading);
+  }
+  return readings;
+}
+
 /**
  * Fetch historical weather readings
  * @param hours - Number of hours to look back (1-168)
+ * @param resolution - Optional bucket size (e.g. "5m", "1h") to have the backend
+ *   aggregate readings; each row then holds the bucket means
  */
-export async function getHistory(hours: number = 24): Promise<HistoryResponse> {
-  const response = await fetch(`${API_URL}/history?hours=${hours}`, {
-    cache: 'no-store',
+export async function getHistory(hours: number = 24, resolution?: string): Promise<HistoryResponse> {
+  // Columnar format with a field projection keeps the payload small
+  let params = `hours=${hours}&format=columnar&fields=${HISTORY_FIELDS.join(',')}`;
+  if (resolution) {
+    params += `&resolution=${resolution}`;
+  }
+  const response = await fetch(`${API_URL}/history?${params}`, {
+    // Revalidate with the backend's ETag on every poll (a 304 when nothing changed)
+    cache: 'no-cache',
   });
   
   if (!response.ok) {
@@ -119,6 +180,11 @@ export async function getHistory(hours: number = 24): Promise<HistoryResponse> {
     };
   }
   
+  if (data.format === 'columnar' && data.columns) {
+    data.readings = columnsToReadings(data.columns);
+    delete data.columns;
+  }
+  
   // Ensure readings array exists
   if (!Array.isArray(data.readings)) {
     console.error('Invalid history data structure:', data);
@@ -5,11 +5,68 @@ A utility class for reading weather data from S3 using AWS Wrangler.
 Designed for use in Jupyter notebooks for ML model development.
 """
 
+import gzip
 import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import awswrangler as wr
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import pandas as pd
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Iterator, List, Optional
+
+
+# Reading keys encode their UTC timestamp: .../2025-10-06T20-15-03.123456Z.json
+_KEY_TS_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2})-(\d{2})-(\d{2})(\.\d+)?Z\.json$")
+
+
+def _key_time(path: str) -> Optional[datetime]:
+    """Timestamp encoded in a reading's key name, or None if it has none."""
+    match = _KEY_TS_RE.search(path)
+    if match is None:
+        return None
+    date, hh, mm, ss, fraction = match.groups()
+    try:
+        return datetime.fromisoformat(f"{date}T{hh}:{mm}:{ss}{fraction or ''}+00:00")
+    except ValueError:
+        return None
+
+
+class _ColumnBuffer:
+    """
+    Collects reading dicts column by column so a DataFrame is built once.
+
+    Fields missing from a reading (or first seen in a later one) are None.
+    """
+
+    def __init__(self, records: Optional[List[dict]] = None):
+        self.columns: dict = {}
+        self.rows = 0
+        if records:
+            self.extend(records)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def append(self, record: dict):
+        for name in record:
+            if name not in self.columns:
+                self.columns[name] = [None] * self.rows
+        for name, values in self.columns.items():
+            values.append(record.get(name))
+        self.rows += 1
+
+    def extend(self, records: List[dict]):
+        for record in records:
+            self.append(record)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns)
 
 
 class WeatherDataReader:
@@ -19,12 +76,16 @@ class WeatherDataReader:
     The data is organized in S3 as:
     - Bronze layer (raw): s3://bucket/samples/YYYY-MM-DD/YYYY-MM-DDTHH-MM-SSZ.json
     - Silver layer (enriched): s3://bucket/silver/YYYY-MM-DD/YYYY-MM-DDTHH-MM-SSZ.json
+    - Finished days are also compacted to s3://bucket/<layer prefix>/compacted/YYYY-MM-DD.ndjson.gz
+    - Each day's objects are listed in s3://bucket/<layer prefix>/manifests/YYYY-MM-DD.json
+    - Gold layer (rollups): s3://bucket/gold/hourly/YYYY-MM-DD.json and s3://bucket/gold/daily/YYYY-MM.json
     
     Example:
         >>> reader = WeatherDataReader(
         ...     bucket="my-weather-bucket",
         ...     bronze_prefix="samples",
-        ...     silver_prefix="silver"
+        ...     silver_prefix="silver",
+        ...     cache_dir="~/.cache/weather"  # optional: keep finished days on disk
         ... )
         >>> # Get last 24 hours of enriched data
         >>> df = reader.get_readings(hours=24, layer="silver")
@@ -41,7 +102,10 @@ class WeatherDataReader:
         bucket: str,
         bronze_prefix: str = "samples",
         silver_prefix: str = "silver",
-        region: str = "us-west-2"
+        region: str = "us-west-2",
+        gold_prefix: str = "gold",
+        max_workers: int = 16,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize the WeatherDataReader.
@@ -51,11 +115,51 @@ class WeatherDataReader:
             bronze_prefix: Prefix for raw data (default: "samples")
             silver_prefix: Prefix for enriched data (default: "silver")
             region: AWS region (default: "us-west-2")
+            gold_prefix: Prefix for hourly/daily rollups (default: "gold")
+            max_workers: Max concurrent S3 downloads when loading days (default: 16)
+            cache_dir: Optional local directory for a Parquet copy of every day
+                read. Compacted (finished) days are then served from disk after a
+                conditional GET of the compacted file (a bodiless 304 unless a
+                backfill recompacted it); other days only download objects not
+                cached yet.
         """
         self.bucket = bucket
         self.bronze_prefix = bronze_prefix.rstrip("/")
         self.silver_prefix = silver_prefix.rstrip("/")
+        self.gold_prefix = gold_prefix.rstrip("/")
         self.region = region
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """
+        The reader's S3 client, created on first use and shared by all calls.
+
+        Its connection pool is sized to max_workers so concurrent downloads
+        reuse connections instead of queueing for one.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        's3',
+                        region_name=self.region,
+                        config=Config(max_pool_connections=max(10, self.max_workers))
+                    )
+        return self._client
+
+    def _map_concurrently(self, fn, items: list) -> list:
+        """Apply fn to every item on up to max_workers threads, keeping the input order."""
+        if len(items) <= 1 or self.max_workers == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="weather-reader"
+        ) as executor:
+            return list(executor.map(fn, items))
     
     def _get_s3_paths_for_dates(
         self,
@@ -81,7 +185,7 @@ class WeatherDataReader:
         
         return paths
 
-    def _read_single_json_file(self, json_file_path: str) -> pd.DataFrame:
+    def _read_json_records(self, json_file_path: str) -> List[dict]:
         """
         Read a single JSON file with robust error handling.
 
@@ -89,7 +193,7 @@ class WeatherDataReader:
             json_file_path: Full S3 path to the JSON file
 
         Returns:
-            DataFrame with the JSON data, or empty DataFrame if reading fails
+            The file's reading(s) as a list of dicts, or an empty list if reading fails
         """
         try:
             # Parse the S3 path to extract bucket and key
@@ -99,11 +203,7 @@ class WeatherDataReader:
             key = path_parts[1]
 
             # Use boto3 directly for more reliable reading
-            import boto3
-            s3_client = boto3.client('s3')
-            
-            # Get the object from S3
-            response = s3_client.get_object(Bucket=bucket, Key=key)
+            response = self.s3_client.get_object(Bucket=bucket, Key=key)
             file_content = response['Body'].read().decode('utf-8')
 
             # Parse the JSON
@@ -111,25 +211,82 @@ class WeatherDataReader:
 
             # Handle different JSON structures
             if isinstance(parsed_json, dict):
-                # Single JSON object - convert to single-row DataFrame
-                return pd.DataFrame([parsed_json])
+                # Single JSON object - one reading
+                return [parsed_json]
             elif isinstance(parsed_json, list):
-                # List of JSON objects - convert directly
-                if len(parsed_json) > 0 and isinstance(parsed_json[0], dict):
-                    return pd.DataFrame(parsed_json)
-                else:
-                    # List of scalar values - skip
-                    return pd.DataFrame()
+                # List of JSON objects - keep the objects
+                return [item for item in parsed_json if isinstance(item, dict)]
             else:
                 # Scalar value - skip
-                return pd.DataFrame()
+                return []
 
         except json.JSONDecodeError as e:
             print(f"Note: {json_file_path} is not valid JSON: {e}")
-            return pd.DataFrame()
+            return []
         except Exception as e:
             print(f"Note: Could not read {json_file_path}: {e}")
-            return pd.DataFrame()
+            return []
+
+    def _read_compacted_day(
+        self,
+        prefix: str,
+        date: str,
+        if_none_match: Optional[str] = None
+    ) -> Optional[tuple]:
+        """
+        Read the compacted NDJSON file for a finished day.
+
+        Args:
+            prefix: Layer prefix (bronze or silver)
+            date: Date string in YYYY-MM-DD format
+            if_none_match: ETag of a copy already held; the body is only
+                downloaded if the file changed since
+
+        Returns:
+            (readings, etag), (None, etag) if the file still has the
+            `if_none_match` ETag, or None if the day has not been compacted
+        """
+        s3_client = self.s3_client
+
+        kwargs = {"Bucket": self.bucket, "Key": f"{prefix}/compacted/{date}.ndjson.gz"}
+        if if_none_match:
+            kwargs["IfNoneMatch"] = if_none_match
+        try:
+            response = s3_client.get_object(**kwargs)
+        except s3_client.exceptions.NoSuchKey:
+            return None
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+                return None, if_none_match
+            raise
+
+        raw = gzip.decompress(response['Body'].read())
+        records = [json.loads(line) for line in raw.decode('utf-8').splitlines() if line]
+        return records, response.get('ETag')
+
+    def _read_manifest_keys(self, prefix: str, date: str) -> Optional[List[str]]:
+        """
+        Read the object keys listed in a day's manifest.
+
+        Args:
+            prefix: Layer prefix (bronze or silver)
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Keys of the day's reading objects, or None if the day has no manifest
+        """
+        s3_client = self.s3_client
+
+        try:
+            response = s3_client.get_object(
+                Bucket=self.bucket,
+                Key=f"{prefix}/manifests/{date}.json"
+            )
+        except s3_client.exceptions.NoSuchKey:
+            return None
+
+        manifest = json.loads(response['Body'].read().decode('utf-8'))
+        return [entry['key'] for entry in manifest.get('objects', [])]
 
     def get_readings(
         self,
@@ -160,6 +317,146 @@ class WeatherDataReader:
         
         return self.get_readings_by_dates(dates, layer, cutoff_time)
     
+    def _cache_paths(self, prefix: str, date: str) -> tuple:
+        """Parquet file and metadata file caching one day of a layer."""
+        day_dir = self.cache_dir / self.bucket / prefix
+        return day_dir / f"{date}.parquet", day_dir / f"{date}.meta.json"
+
+    def _read_cached_day(self, prefix: str, date: str) -> Optional[tuple]:
+        """
+        Read a day from the local cache.
+
+        Returns:
+            (DataFrame, metadata) or None if the day is not cached. Metadata has
+            "complete" and "etag" (the day came from the compacted file with that
+            ETag) or "keys" (the objects already included, for days that are
+            still being written).
+        """
+        parquet_path, meta_path = self._cache_paths(prefix, date)
+        if not (parquet_path.exists() and meta_path.exists()):
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            return pd.read_parquet(parquet_path), meta
+        except Exception as e:
+            print(f"Note: Ignoring unreadable cache for {date}: {e}")
+            return None
+
+    def _write_cached_day(self, prefix: str, date: str, df: pd.DataFrame, meta: dict):
+        """Store a day in the local cache (best effort; failures only print a note)."""
+        parquet_path, meta_path = self._cache_paths(prefix, date)
+        try:
+            parquet_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write both files atomically; the metadata goes last so a crash in
+            # between leaves a cache entry that is simply ignored
+            tmp_parquet = parquet_path.with_name(parquet_path.name + ".tmp")
+            df.reset_index(drop=True).to_parquet(tmp_parquet, index=False)
+            os.replace(tmp_parquet, parquet_path)
+            tmp_meta = meta_path.with_name(meta_path.name + ".tmp")
+            with open(tmp_meta, "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, meta_path)
+        except Exception as e:
+            print(f"Note: Could not cache {date}: {e}")
+
+    def _locate_day(
+        self,
+        prefix: str,
+        date: str,
+        today: str,
+        cutoff_time: Optional[datetime] = None
+    ) -> dict:
+        """
+        Find where one day's readings live.
+
+        Returns:
+            Dict with "date", "frame" (DataFrame from the local cache, or None),
+            "records" (readings from the compacted file), "files" (S3 paths of
+            JSON files still to download) and "cached_keys" (paths already in
+            the local cache for a day that is still being written, or None)
+        """
+        day = {"date": date, "frame": None, "records": [], "files": [], "cached_keys": None}
+
+        complete = False
+        cached = self._read_cached_day(prefix, date) if self.cache_dir else None
+        if cached is not None:
+            day["frame"], meta = cached
+            complete = bool(meta.get("complete"))
+            if complete and date >= today:
+                return day
+            if not complete:
+                day["cached_keys"] = set(meta.get("keys", []))
+
+        # Finished days are read from a single compacted file when available.
+        # A cached copy is revalidated by ETag: a backfill may have recompacted it.
+        if date < today:
+            try:
+                compacted = self._read_compacted_day(
+                    prefix, date, if_none_match=meta.get("etag") if complete else None
+                )
+                if compacted is not None:
+                    records, etag = compacted
+                    if records is None:
+                        return day
+                    day["frame"], day["cached_keys"] = None, None
+                    if self.cache_dir:
+                        day["frame"] = _ColumnBuffer(records).to_frame()
+                        self._write_cached_day(prefix, date, day["frame"], {"complete": True, "etag": etag})
+                    else:
+                        day["records"] = records
+                    return day
+                if complete:
+                    # The compacted file is gone; read the day's objects instead
+                    day["frame"] = None
+            except Exception as e:
+                print(f"Note: Could not read compacted file for {date}: {e}")
+                if complete:
+                    print(f"Note: Using the cached copy of {date}")
+                    return day
+
+        try:
+            # The day's manifest names its objects without a listing;
+            # otherwise list all JSON files in the date directory
+            date_path = f"s3://{self.bucket}/{prefix}/{date}/"
+            try:
+                manifest_keys = self._read_manifest_keys(prefix, date)
+            except Exception as e:
+                print(f"Note: Could not read manifest for {date}: {e}")
+                manifest_keys = None
+            if manifest_keys is not None:
+                json_files = [f"s3://{self.bucket}/{key}" for key in manifest_keys]
+            else:
+                json_files = wr.s3.list_objects(date_path)
+
+            if not json_files:
+                print(f"Note: No files found in {date_path}")
+                return day
+
+            # Filter for .json files only
+            json_files = [f for f in json_files if f.endswith('.json')]
+
+            if not json_files:
+                print(f"Note: No JSON files found in {date_path}")
+                return day
+
+            # Skip objects whose key already says they are before the cutoff
+            if cutoff_time:
+                json_files = [
+                    f for f in json_files
+                    if (_key_time(f) or cutoff_time) >= cutoff_time
+                ]
+
+            # Objects already in the local cache are not downloaded again
+            if day["cached_keys"]:
+                json_files = [f for f in json_files if f not in day["cached_keys"]]
+            day["files"] = json_files
+            return day
+
+        except Exception as e:
+            print(f"Note: Could not list files for date {date}: {e}")
+            return day
+
     def get_readings_by_dates(
         self,
         dates: List[str],
@@ -169,6 +466,9 @@ class WeatherDataReader:
         """
         Get weather readings for specific dates.
 
+        Days and their per-reading files are downloaded concurrently on up to
+        max_workers threads.
+
         Args:
             dates: List of date strings in YYYY-MM-DD format
             layer: "bronze" or "silver" (default: "silver")
@@ -178,47 +478,55 @@ class WeatherDataReader:
             DataFrame with weather readings sorted by timestamp
         """
         prefix = self.silver_prefix if layer == "silver" else self.bronze_prefix
-        all_data = []
-
-        for date in dates:
-            try:
-                # List all JSON files in the date directory
-                date_path = f"s3://{self.bucket}/{prefix}/{date}/"
-                json_files = wr.s3.list_objects(date_path)
-
-                if not json_files:
-                    print(f"Note: No files found in {date_path}")
-                    continue
-
-                # Filter for .json files only
-                json_files = [f for f in json_files if f.endswith('.json')]
-
-                if not json_files:
-                    print(f"Note: No JSON files found in {date_path}")
-                    continue
-
-                # Read all JSON files for this date
-                for json_file in json_files:
-                    try:
-                        # Try to read the JSON file with different approaches
-                        df = self._read_single_json_file(json_file)
-
-                        if df is not None and not df.empty:
-                            all_data.append(df)
-
-                    except Exception as e:
-                        print(f"Note: Could not read {json_file}: {e}")
-                        continue
-
-            except Exception as e:
-                print(f"Note: Could not list files for date {date}: {e}")
-                continue
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+        # Locate every day concurrently (local cache, then one compacted file,
+        # manifest or listing per day), then download all remaining per-reading
+        # files in one pass
+        days = self._map_concurrently(
+            lambda date: self._locate_day(prefix, date, today, cutoff_time),
+            dates
+        )
+        json_files = [f for day in days for f in day["files"]]
+        downloaded = dict(zip(
+            json_files,
+            self._map_concurrently(self._read_json_records, json_files)
+        ))
+
+        # Downloaded readings go into one set of column buffers and become a
+        # DataFrame once; only days from the local cache arrive as frames
+        frames = []
+        buffer = _ColumnBuffer()
+        for day in days:
+            new_files = [f for f in day["files"] if downloaded[f]]
+            if day["frame"] is not None and not day["frame"].empty and not (self.cache_dir and new_files):
+                frames.append(day["frame"])
+            buffer.extend(day["records"])
+
+            if self.cache_dir and new_files:
+                # Days still being written are cached with the objects they include,
+                # so the next call only downloads what was added since
+                day_buffer = _ColumnBuffer()
+                for f in new_files:
+                    day_buffer.extend(downloaded[f])
+                parts = [df for df in (day["frame"], day_buffer.to_frame()) if df is not None and not df.empty]
+                day_frame = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+                self._write_cached_day(prefix, day["date"], day_frame, {
+                    "complete": False,
+                    "keys": sorted((day["cached_keys"] or set()) | set(new_files)),
+                })
+                frames.append(day_frame)
+            else:
+                for f in new_files:
+                    buffer.extend(downloaded[f])
 
-        if not all_data:
+        if len(buffer):
+            frames.append(buffer.to_frame())
+        if not frames:
             return pd.DataFrame()
 
         # Combine all dataframes
-        combined_df = pd.concat(all_data, ignore_index=True)
+        combined_df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
 
         # Convert timestamp to datetime
         combined_df['timestamp'] = pd.to_datetime(
@@ -263,7 +571,95 @@ class WeatherDataReader:
             current += timedelta(days=1)
         
         return self.get_readings_by_dates(dates, layer)
+
+    def iter_readings(
+        self,
+        start,
+        end,
+        chunk: str = "1D",
+        layer: str = "silver"
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over readings in [start, end) as DataFrames of one chunk each.
+
+        Days are loaded one at a time and each chunk is yielded as soon as it is
+        complete, so memory stays bounded by roughly one chunk plus one day no
+        matter how long the range is.
+
+        Args:
+            start: Start time (inclusive); a datetime or string such as "2025-10-01".
+                Naive values are treated as UTC.
+            end: End time (exclusive), same forms as start
+            chunk: Pandas offset alias for the chunk length, e.g. "6h", "1D", "7D"
+            layer: "bronze" or "silver" (default: "silver")
+
+        Yields:
+            Non-empty DataFrames shaped like get_readings_by_dates, in time order
+
+        Example:
+            >>> for df in reader.iter_readings("2025-08-01", "2025-10-01", chunk="7D"):
+            ...     process(df)
+        """
+        start_ts = pd.Timestamp(start)
+        end_ts = pd.Timestamp(end)
+        start_ts = start_ts.tz_localize("UTC") if start_ts.tzinfo is None else start_ts.tz_convert("UTC")
+        end_ts = end_ts.tz_localize("UTC") if end_ts.tzinfo is None else end_ts.tz_convert("UTC")
+        step = pd.tseries.frequencies.to_offset(chunk)
+
+        chunk_end = start_ts + step
+        pending = None
+        for day_start in pd.date_range(start_ts.normalize(), end_ts, freq="1D", inclusive="left"):
+            df = self.get_readings_by_dates([day_start.strftime("%Y-%m-%d")], layer)
+            if not df.empty:
+                df = df[(df['timestamp'] >= start_ts) & (df['timestamp'] < end_ts)]
+                pending = df if pending is None else pd.concat([pending, df], ignore_index=True)
+
+            # Every chunk ending by the next midnight is now complete
+            day_end = min(day_start + pd.Timedelta(days=1), end_ts)
+            while chunk_end <= day_end:
+                if pending is not None:
+                    done = pending['timestamp'] < chunk_end
+                    if done.any():
+                        yield pending[done].reset_index(drop=True)
+                    pending = pending[~done].reset_index(drop=True)
+                chunk_end += step
+
+        if pending is not None and not pending.empty:
+            yield pending.reset_index(drop=True)
     
+    def add_derived_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute dew point and comfort index for every row in one vectorized pass.
+
+        Uses the backend's batch calculations, so values match what the collector
+        writes to the silver layer exactly. Handy for bronze data or for
+        recomputing silver metrics after a formula change. Needs the backend
+        package installed (the models image does; from a checkout run
+        `pip install --no-deps -e backend`).
+
+        Args:
+            df: DataFrame with temp_c, temp_f and humidity columns
+
+        Returns:
+            Copy of df with dew_point_c, dew_point_f and comfort_index columns
+        """
+        from weather.vectorized import enrich_batch, comfort_labels
+
+        if df.empty:
+            return df.copy()
+
+        enriched = enrich_batch(
+            df["temp_c"].to_numpy(dtype=float),
+            df["temp_f"].to_numpy(dtype=float),
+            df["humidity"].to_numpy(dtype=float)
+        )
+
+        result = df.copy()
+        result["dew_point_c"] = enriched["dew_point_c"]
+        result["dew_point_f"] = enriched["dew_point_f"]
+        result["comfort_index"] = comfort_labels(enriched["comfort_code"])
+        return result
+
     def get_latest_reading(self, layer: str = "silver") -> Optional[dict]:
         """
         Get the most recent weather reading.
@@ -284,11 +680,86 @@ class WeatherDataReader:
         
         return latest_row.to_dict()
     
+    def _get_gold_daily_aggregates(self, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Read daily rollups from the gold layer (one object per month).
+
+        A day whose rollup count doesn't match the number of readings in its
+        silver manifest (an update that failed or lost a race) is aggregated
+        from silver instead, so short counts are never returned.
+
+        Returns:
+            DataFrame shaped like get_daily_aggregates, with min/max/mean/count
+            per metric (std is not available from rollups)
+        """
+        s3_client = self.s3_client
+
+        months = pd.period_range(start=start_date[:7], end=end_date[:7], freq="M")
+        rows = {}
+        gold_counts = {}
+        metrics = set()
+        for month in months:
+            try:
+                response = s3_client.get_object(
+                    Bucket=self.bucket,
+                    Key=f"{self.gold_prefix}/daily/{month.strftime('%Y-%m')}.json"
+                )
+            except s3_client.exceptions.NoSuchKey:
+                print(f"Note: No gold rollups for {month}")
+                continue
+
+            for bucket in json.loads(response['Body'].read().decode('utf-8')).get("buckets", []):
+                date = bucket["ts"][:10]
+                if not (start_date <= date <= end_date):
+                    continue
+                row = {}
+                for metric, agg in bucket["metrics"].items():
+                    row[(metric, 'min')] = agg["min"]
+                    row[(metric, 'max')] = agg["max"]
+                    row[(metric, 'mean')] = agg["sum"] / agg["count"] if agg["count"] else None
+                    row[(metric, 'count')] = agg["count"]
+                    metrics.add(metric)
+                rows[datetime.strptime(date, "%Y-%m-%d").date()] = row
+                gold_counts[date] = bucket["count"]
+
+        dates = sorted(gold_counts)
+        manifests = self._map_concurrently(
+            lambda date: self._read_manifest_keys(self.silver_prefix, date), dates
+        )
+        stale = [
+            date for date, keys in zip(dates, manifests)
+            if keys is not None and len(keys) != gold_counts[date]
+        ]
+        if stale:
+            print(f"Note: Gold rollups incomplete for {', '.join(stale)}, aggregating silver")
+            df = self.get_readings_by_dates(stale, "silver")
+            if not df.empty:
+                for date, group in df.groupby(df['timestamp'].dt.date):
+                    row = {}
+                    for metric in sorted(metrics):
+                        if metric not in group:
+                            continue
+                        values = group[metric].dropna()
+                        row[(metric, 'min')] = values.min() if len(values) else None
+                        row[(metric, 'max')] = values.max() if len(values) else None
+                        row[(metric, 'mean')] = values.mean() if len(values) else None
+                        row[(metric, 'count')] = len(values)
+                    rows[date] = row
+
+        if not rows:
+            return pd.DataFrame()
+
+        daily_stats = pd.DataFrame.from_dict(rows, orient='index').sort_index()
+        daily_stats.columns = pd.MultiIndex.from_tuples(daily_stats.columns)
+        daily_stats.index.name = 'date'
+        return daily_stats.reset_index()
+
     def get_daily_aggregates(
         self,
         start_date: str,
         end_date: str,
-        layer: str = "silver"
+        layer: str = "silver",
+        use_gold: bool = False
     ) -> pd.DataFrame:
         """
         Get daily aggregated statistics for a date range.
@@ -297,10 +768,18 @@ class WeatherDataReader:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             layer: "bronze" or "silver" (default: "silver")
+            use_gold: Read precomputed daily rollups from the gold layer instead
+                of aggregating every reading (silver only; one GET per month)
             
         Returns:
             DataFrame with daily min/max/mean/std statistics
+            (min/max/mean/count when use_gold is True)
         """
+        if use_gold:
+            if layer != "silver":
+                raise ValueError("Gold rollups are built from the silver layer only")
+            return self._get_gold_daily_aggregates(start_date, end_date)
+
         df = self.get_readings_by_date_range(start_date, end_date, layer)
         
         if df.empty: